@@ -1,10 +1,54 @@
 import os
+import re
+import zlib
+import hashlib
 import shutil
 import fnmatch
 import zipfile
 import logging
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+# ISA-L ships a SIMD-accelerated, zlib-compatible DEFLATE implementation. It is part of the
+# dp environment and used for the archive when available; otherwise the stdlib zlib is used.
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+# Default exclude patterns. Each pattern is matched against the absolute path and against the path
+# relative to the components directory (the file name for the top-level files); either match excludes.
+DEFAULT_EXCLUDE_PATTERNS: Tuple[str, ...] = (
+    '*.env',
+    '*venv*',
+    '*.pyc',
+    '__pycache__/*',
+    '*.pyo',
+    '.git/*',
+    '.gitignore',
+    '.DS_Store'
+)
+
+# Location of the components directory inside the zip
+COMPONENTS_ARCNAME_PREFIX = "src/dc_custom_component/components/"
+
+# Copy buffer size used when streaming files into the archive
+STREAM_CHUNK_SIZE = 1 << 20
+
+# DEFLATE level for the archive. Level 1 is several times faster than the default (6) on
+# source files at a marginal cost in archive size. Override with the ZIP_LEVEL environment variable.
+DEFAULT_COMPRESSION_LEVEL = 1
+
+# Files smaller than this, or with one of these suffixes, are stored without compression:
+# DEFLATE saves next to nothing on them but still costs CPU time.
+STORED_MAX_SIZE = 256
+PRECOMPRESSED_SUFFIXES = frozenset({'.gz', '.zst', '.bz2', '.xz', '.zip', '.whl', '.png', '.jpg', '.jpeg'})
+
+# Below this many files, the cost of starting worker processes outweighs parallel compression
+PARALLEL_MIN_FILES = 64
 
 # Configure logging
 logging.basicConfig(
@@ -14,8 +58,188 @@ logging.basicConfig(
 )
 
 
+@lru_cache(maxsize=None)
+def _compile_exclude_patterns(exclude_patterns: Tuple[str, ...]) -> re.Pattern:
+    """
+    Combine glob-style exclude patterns into a single compiled regex.
+
+    Matching one regex per path is much cheaper than calling fnmatch once per pattern.
+    """
+    if not exclude_patterns:
+        # Matches nothing
+        return re.compile(r"(?!)")
+    return re.compile("|".join(fnmatch.translate(pat) for pat in exclude_patterns))
+
+
+def compile_exclude_patterns(exclude_patterns: Sequence[str]) -> re.Pattern:
+    """
+    Get the compiled regex for a list of exclude patterns.
+
+    The result is cached, so the manifest check and the zip build share one compiled pattern.
+    """
+    return _compile_exclude_patterns(tuple(exclude_patterns))
+
+
+def _is_excluded(excluded: re.Pattern, path: str, rel_path: str) -> bool:
+    """
+    Check a path against the exclude patterns in both its absolute and its relative form.
+
+    Relative matching lets patterns like '.git/*' work, absolute matching keeps patterns like
+    '*/tests/*' working as they did before relative paths were introduced.
+    """
+    return excluded.match(rel_path) is not None or excluded.match(path) is not None
+
+
+def _iter_files(root: str, excluded: re.Pattern, _prefix: str = "") -> Iterator[Tuple[str, str]]:
+    """
+    Recursively yield (absolute_path, relative_path) for all files below root.
+
+    Uses os.scandir so that file type checks are served from the cached directory entry
+    instead of an extra stat() per entry. Directories matching an exclude pattern are not descended into.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            rel_path = _prefix + entry.name
+            if _is_excluded(excluded, entry.path, rel_path):
+                logging.debug(f"Excluding: {entry.path}")
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path, excluded, rel_path + "/")
+            elif entry.is_file():
+                yield entry.path, rel_path
+
+
+def _compress_type_for(zinfo: zipfile.ZipInfo, default: int) -> int:
+    """
+    Choose the compression method for a single archive entry.
+    """
+    if zinfo.file_size < STORED_MAX_SIZE or os.path.splitext(zinfo.filename)[1].lower() in PRECOMPRESSED_SUFFIXES:
+        return zipfile.ZIP_STORED
+    return default
+
+
+def _write_file(zipf: zipfile.ZipFile, file_path: str, arcname: str) -> None:
+    """
+    Stream a single file into the archive using a 1 MiB copy buffer.
+
+    Large files are never loaded into memory as a whole.
+    """
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+    zinfo.compress_type = _compress_type_for(zinfo, zipf.compression)
+    zinfo._compresslevel = zipf.compresslevel  # mirrors what ZipFile.write does internally
+    with open(file_path, 'rb') as src, zipf.open(zinfo, 'w') as dst:
+        shutil.copyfileobj(src, dst, length=STREAM_CHUNK_SIZE)
+
+
+@contextmanager
+def _deflate_backend(compresslevel: int) -> Iterator[int]:
+    """
+    Switch zipfile to the ISA-L DEFLATE and CRC32 implementations while the archive is written.
+
+    zipfile's own zlib and crc32 are restored on exit, so the rest of the process is not affected.
+    ISA-L only supports levels 0-3, so the level is clamped accordingly.
+    Yields the compression level to use with the selected backend.
+    """
+    if isal_zlib is None:
+        yield compresslevel
+        return
+
+    original_zlib, original_crc32 = zipfile.zlib, zipfile.crc32  # type: ignore[attr-defined]
+    zipfile.zlib = isal_zlib  # type: ignore[attr-defined]
+    # zipfile binds crc32 at import time, so it has to be replaced separately.
+    # ISA-L computes it with carry-less multiplication (PCLMULQDQ) instructions.
+    zipfile.crc32 = isal_zlib.crc32  # type: ignore[attr-defined]
+    logging.info("Using ISA-L for DEFLATE compression")
+    try:
+        yield min(compresslevel, isal_zlib.ISAL_BEST_COMPRESSION)
+    finally:
+        zipfile.zlib = original_zlib  # type: ignore[attr-defined]
+        zipfile.crc32 = original_crc32  # type: ignore[attr-defined]
+
+
+def _compress_file(file_path: str, compress_type: int, compresslevel: int) -> Tuple[int, int, bytes]:
+    """
+    Compress a file into a raw DEFLATE stream, as stored in zip archives.
+
+    Runs in a worker process. Returns (crc32, uncompressed_size, compressed_data).
+    For ZIP_STORED entries the data is returned as is.
+    """
+    backend = isal_zlib if isal_zlib is not None else zlib
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    if compress_type == zipfile.ZIP_STORED:
+        return backend.crc32(data), len(data), data
+    compressor = backend.compressobj(compresslevel, backend.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush()
+    return backend.crc32(data), len(data), compressed
+
+
+# zipfile has no public API for writing already compressed data, so _write_precompressed uses
+# these internals of CPython's ZipFile. They are checked before the parallel path is taken, and
+# tests/scripts/test_build_custom_components.py round-trips the result through testzip() on the
+# Python version pinned in pyproject.toml.
+PRECOMPRESSED_ZIPFILE_INTERNALS = ('fp', 'start_dir', '_writecheck', '_didModify', '_seekable')
+
+
+def _supports_precompressed(zipf: zipfile.ZipFile) -> bool:
+    """
+    Check whether an open archive exposes the internals _write_precompressed relies on.
+    """
+    return all(hasattr(zipf, name) for name in PRECOMPRESSED_ZIPFILE_INTERNALS) and zipf._seekable
+
+
+def _write_precompressed(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, crc: int, file_size: int,
+                         compressed: bytes) -> None:
+    """
+    Append an already compressed entry to the archive, using zinfo.compress_type as the method.
+
+    This follows what ZipFile.open(..., 'w') does when writing to a seekable file; callers check
+    _supports_precompressed first. Because CRC and sizes are known up front, the local header is
+    written only once.
+    """
+    zinfo.CRC = crc
+    zinfo.file_size = file_size
+    zinfo.compress_size = len(compressed)
+    zinfo.flag_bits = 0x00
+    zip64 = file_size > zipfile.ZIP64_LIMIT or len(compressed) > zipfile.ZIP64_LIMIT
+
+    zipf.fp.seek(zipf.start_dir)
+    zinfo.header_offset = zipf.fp.tell()
+    zipf._writecheck(zinfo)
+    zipf._didModify = True
+    zipf.fp.write(zinfo.FileHeader(zip64))
+    zipf.fp.write(compressed)
+    zipf.start_dir = zipf.fp.tell()
+
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+
+
+def _write_files_parallel(zipf: zipfile.ZipFile, files: List[Tuple[str, str]], compresslevel: int,
+                          max_workers: Optional[int]) -> None:
+    """
+    Compress files in a process pool and write them to the archive in order from the main process.
+    """
+    zinfos = []
+    for file_path, arcname in files:
+        zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+        zinfo.compress_type = _compress_type_for(zinfo, zipfile.ZIP_DEFLATED)
+        zinfos.append(zinfo)
+
+    paths = [file_path for file_path, _ in files]
+    compress_types = [zinfo.compress_type for zinfo in zinfos]
+    levels = [compresslevel] * len(paths)
+    chunksize = max(1, len(paths) // ((max_workers or os.cpu_count() or 1) * 4))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(_compress_file, paths, compress_types, levels, chunksize=chunksize)
+        for zinfo, (crc, file_size, compressed) in zip(zinfos, results):
+            _write_precompressed(zipf, zinfo, crc, file_size, compressed)
+
+
 def create_zip_file(components_dir: Path, about_init_dir: Path, output_zip: Path, project_root: Path,
-                    exclude_patterns: Optional[List[str]] = None) -> bool:
+                    exclude_patterns: Optional[List[str]] = None,
+                    compresslevel: int = DEFAULT_COMPRESSION_LEVEL, max_workers: Optional[int] = None) -> bool:
     """
     Create a zip file with the following structure:
     - pyproject.toml (at root)
@@ -23,20 +247,15 @@ def create_zip_file(components_dir: Path, about_init_dir: Path, output_zip: Path
     - src/dc_custom_component/__about__.py
     - src/dc_custom_component/__init__.py
     While applying exclude patterns to filter unwanted files.
+
+    Large component trees are compressed in parallel using up to max_workers processes (default: CPU count).
+    Pass max_workers=1 to always compress serially.
     """
 
     if exclude_patterns is None:
-        exclude_patterns = [
-            '*.env',
-            '*venv*',
-            '*.pyc',
-            '__pycache__/*',
-            '*.pyo',
-            '.git/*',
-            '.gitignore',
-            '.DS_Store'
-        ]
+        exclude_patterns = list(DEFAULT_EXCLUDE_PATTERNS)
 
+    # Accept both str and Path arguments; the per-file loop below works on plain strings
     components_path = Path(components_dir)
     about_init_path = Path(about_init_dir)
     output_path = Path(output_zip)
@@ -51,47 +270,42 @@ def create_zip_file(components_dir: Path, about_init_dir: Path, output_zip: Path
         logging.error(f"Custom component directory does not exist: {about_init_path}")
         return False
 
-    # Count the files in the components directory
-    files_count: int = sum(1 for _ in components_path.glob('**/*') if _.is_file())
-    logging.info(f"Found {files_count} files in components directory")
-
-    if files_count == 0:
-        logging.warning(f"Components directory appears to be empty: {components_path}")
+    excluded = compile_exclude_patterns(exclude_patterns)
 
     # Ensure the output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     files_added: int = 0
 
-    with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+    with (_deflate_backend(compresslevel) as compresslevel,
+          zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zipf):
         # -- 1) Add all files from components directory except excluded
-        for root, dirs, files in os.walk(components_path):
-            # Filter out excluded dirs so os.walk doesn't descend into them
-            dirs[:] = [
-                d for d in dirs
-                if not any(fnmatch.fnmatch(str(Path(root, d)), pat) for pat in exclude_patterns)
-            ]
-
-            for file in files:
-                file_path = Path(root) / file
-                if any(fnmatch.fnmatch(str(file_path), pat) for pat in exclude_patterns):
-                    logging.debug(f"Excluding file: {file_path}")
-                    continue
-
-                # Write it to the ZIP with a path relative to components_path
-                rel_path = file_path.relative_to(components_path)
-                # Put it under src/dc_custom_component/components in the zip
-                zip_path = Path("src") / "dc_custom_component" / "components" / rel_path
-                zipf.write(file_path, arcname=str(zip_path))
-                files_added += 1
+        # Put everything under src/dc_custom_component/components in the zip
+        component_files = [
+            (file_path, COMPONENTS_ARCNAME_PREFIX + rel_path)
+            for file_path, rel_path in _iter_files(os.fspath(components_path), excluded)
+        ]
+
+        if (max_workers != 1 and len(component_files) >= PARALLEL_MIN_FILES
+                and _supports_precompressed(zipf)):
+            _write_files_parallel(zipf, component_files, compresslevel, max_workers)
+        else:
+            for file_path, arcname in component_files:
+                _write_file(zipf, file_path, arcname)
+        files_added += len(component_files)
+
+        logging.info(f"Added {files_added} files from components directory")
+
+        if files_added == 0:
+            logging.warning(f"Components directory appears to be empty: {components_path}")
 
         # -- 2) Add __about__.py and __init__.py from dc_custom_component directory
         about_file = about_init_path / "__about__.py"
         init_file = about_init_path / "__init__.py"
 
         if about_file.exists():
-            if not any(fnmatch.fnmatch(str(about_file), pat) for pat in exclude_patterns):
-                zipf.write(about_file, arcname="src/dc_custom_component/__about__.py")
+            if not _is_excluded(excluded, os.fspath(about_file), about_file.name):
+                _write_file(zipf, os.fspath(about_file), "src/dc_custom_component/__about__.py")
                 files_added += 1
                 logging.info("Added __about__.py to src/dc_custom_component/")
             else:
@@ -100,8 +314,8 @@ def create_zip_file(components_dir: Path, about_init_dir: Path, output_zip: Path
             logging.warning(f"__about__.py not found in {about_init_path}")
 
         if init_file.exists():
-            if not any(fnmatch.fnmatch(str(init_file), pat) for pat in exclude_patterns):
-                zipf.write(init_file, arcname="src/dc_custom_component/__init__.py")
+            if not _is_excluded(excluded, os.fspath(init_file), init_file.name):
+                _write_file(zipf, os.fspath(init_file), "src/dc_custom_component/__init__.py")
                 files_added += 1
                 logging.info("Added __init__.py to src/dc_custom_component/")
             else:
@@ -113,17 +327,22 @@ def create_zip_file(components_dir: Path, about_init_dir: Path, output_zip: Path
         pyproject_file = root_path / "pyproject.toml"
         if pyproject_file.exists():
             # Optionally honor exclude patterns here if you want
-            if not any(fnmatch.fnmatch(str(pyproject_file), pat) for pat in exclude_patterns):
-                zipf.write(pyproject_file, arcname="pyproject.toml")
+            if not _is_excluded(excluded, os.fspath(pyproject_file), pyproject_file.name):
+                _write_file(zipf, os.fspath(pyproject_file), "pyproject.toml")
                 files_added += 1
             else:
                 logging.debug("Excluding pyproject.toml due to pattern")
 
         readme_file = root_path / "README.md"
         if readme_file.exists():
-            zipf.write(readme_file, arcname="README.md")
+            _write_file(zipf, os.fspath(readme_file), "README.md")
             files_added += 1
 
+        # List the contents of the zip file for verification; the writer already tracks every entry
+        logging.info("Zip file contents:")
+        for info in zipf.infolist():
+            logging.info(f"  {info.filename} ({info.file_size} bytes)")
+
     logging.info(f"Added {files_added} files to the zip archive")
 
     # Verify the zip file was created and is non-empty
@@ -134,15 +353,36 @@ def create_zip_file(components_dir: Path, about_init_dir: Path, output_zip: Path
     if files_added == 0:
         logging.warning(f"Created zip file is empty: {output_path}")
 
-    # List the contents of the zip file for verification
-    logging.info("Zip file contents:")
-    with zipfile.ZipFile(output_path, 'r') as zipf:
-        for info in zipf.infolist():
-            logging.info(f"  {info.filename} ({info.file_size} bytes)")
-
     return True
 
 
+def compute_manifest(components_dir: Path, about_init_dir: Path, project_root: Path, exclude_patterns: List[str],
+                     compresslevel: int) -> str:
+    """
+    Compute a hash over the (path, size, mtime) of every file that goes into the zip.
+
+    The compression level, the DEFLATE backend (ISA-L or zlib) and the exclude patterns are part of the hash,
+    so changing any of them triggers a rebuild.
+    """
+    excluded = compile_exclude_patterns(exclude_patterns)
+    files = [file_path for file_path, _ in sorted(_iter_files(os.fspath(components_dir), excluded), key=lambda f: f[1])]
+    files += [os.fspath(about_init_dir / "__about__.py"), os.fspath(about_init_dir / "__init__.py"),
+              os.fspath(project_root / "pyproject.toml"), os.fspath(project_root / "README.md")]
+
+    backend = "isal" if isal_zlib is not None else "zlib"
+    manifest = hashlib.sha256(f"compresslevel={compresslevel}\nbackend={backend}\n".encode())
+    for pattern in exclude_patterns:
+        manifest.update(f"exclude={pattern}\0".encode())
+    manifest.update(b"\n")
+    for file_path in files:
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            continue
+        manifest.update(f"{file_path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return manifest.hexdigest()
+
+
 def main() -> int:
     # Define paths relative to the project root
     project_root = Path.cwd()
@@ -151,23 +391,22 @@ def main() -> int:
     about_init_dir = project_root / "src" / "dc_custom_component"
     dist_dir = project_root / "dist/components"
     output_zip = dist_dir / "custom_component.zip"  # Renamed to dc_custom_component.zip
+    manifest_file = dist_dir / ".manifest"
 
     logging.info(f"Project root: {project_root}")
     logging.info(f"Components directory: {components_dir}")
     logging.info(f"DC custom component directory: {about_init_dir}")
     logging.info(f"Output zip: {output_zip}")
 
-    # Default exclude patterns
-    exclude_patterns: List[str] = [
-        '*.env',
-        '*venv*',
-        '*.pyc',
-        '__pycache__/*',
-        '*.pyo',
-        '.git/*',
-        '.gitignore',
-        '.DS_Store'
-    ]
+    exclude_patterns: List[str] = list(DEFAULT_EXCLUDE_PATTERNS)
+
+    compresslevel = int(os.environ.get("ZIP_LEVEL", DEFAULT_COMPRESSION_LEVEL))
+
+    # Skip the build if none of the input files changed since the last build
+    manifest = compute_manifest(components_dir, about_init_dir, project_root, exclude_patterns, compresslevel)
+    if output_zip.exists() and manifest_file.exists() and manifest_file.read_text() == manifest:
+        logging.info(f"Components unchanged since last build, keeping {output_zip}")
+        return 0
 
     # Remove existing dist directory if it exists
     if dist_dir.exists():
@@ -185,10 +424,12 @@ def main() -> int:
         about_init_dir=about_init_dir,
         output_zip=output_zip,
         project_root=project_root,
-        exclude_patterns=exclude_patterns
+        exclude_patterns=exclude_patterns,
+        compresslevel=compresslevel
     )
 
     if success:
+        manifest_file.write_text(manifest)
         logging.info(f"Successfully created {output_zip}")
     else:
         logging.error(f"Failed to create {output_zip}")
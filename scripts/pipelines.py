@@ -0,0 +1,50 @@
+import argparse
+import logging
+from typing import List, Optional
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run one or more pipeline commands in a single Python process.
+
+    Haystack and the pipelines are imported only once, and YAML serialized by `test` is reused by `write`.
+    Example: `python scripts/pipelines.py test write`
+
+    :param argv: Command line arguments, defaults to sys.argv
+    :return: 0 if all commands succeeded, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(description="Validate and serialize the pipelines in dc_custom_component.pipelines")
+    parser.add_argument(
+        "commands",
+        nargs="+",
+        choices=["test", "write"],
+        help="'test' checks that all pipelines can be serialized, 'write' saves them to dist/pipelines",
+    )
+    args = parser.parse_args(argv)
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    import serialize_pipelines
+    import test_pipeline_serialization
+
+    exit_code = 0
+    for command in args.commands:
+        logger.info(f"Running '{command}'")
+        if command == "test":
+            if test_pipeline_serialization.main() != 0:
+                exit_code = 1
+        elif command == "write":
+            if serialize_pipelines.main():
+                exit_code = 1
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    exit(main())
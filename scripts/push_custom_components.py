@@ -3,6 +3,7 @@ import os
 import logging
 
 from pathlib import Path
+from requests_toolbelt import MultipartEncoder
 
 # Configure logging
 logging.basicConfig(
@@ -30,13 +31,17 @@ def upload_custom_component():
         # Prepare the file to upload
         root_path = Path.cwd()
         with open(root_path / 'dist/components/custom_component.zip', 'rb') as file_data:
-            files = {
-                'file': ('custom_component.zip', file_data, 'application/zip')
-            }
+            # Stream the multipart body from the file instead of building it in memory
+            encoder = MultipartEncoder(
+                fields={
+                    'file': ('custom_component.zip', file_data, 'application/zip')
+                }
+            )
+            headers['Content-Type'] = encoder.content_type
 
             # Make the POST request
             logger.info(f"Uploading custom component to {url}")
-            response = requests.post(url, headers=headers, files=files)
+            response = requests.post(url, headers=headers, data=encoder)
 
             # Log response
             logger.info(f"Status Code: {response.status_code}")
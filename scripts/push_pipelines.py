@@ -1,7 +1,10 @@
+import json
+import orjson
 import requests
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import os
 
 # Setup logging
@@ -12,6 +15,28 @@ logger = logging.getLogger(__name__)
 API_URL = os.environ.get('DP_API_URL', 'https://api.cloud.deepset.ai')
 API_KEY = os.environ.get('DP_API_KEY', '')
 
+# Used in place of a missing indexing pipeline
+EMPTY_PIPELINE_YAML = "# Empty Pipeline"
+
+# Number of pipelines synced concurrently; the work is network-bound
+MAX_WORKERS = 16
+# (connect, read) timeout in seconds for API requests
+REQUEST_TIMEOUT = (5, 30)
+
+# Request bodies are encoded with orjson, which is much faster than the stdlib json used by requests' json=
+JSON_CONTENT_TYPE = {"content-type": "application/json"}
+
+# Remote pipeline YAML is cached here together with its ETag, for conditional requests
+REMOTE_CACHE_DIR = Path(".cache") / "remote_pipelines"
+
+# Shared session so all requests reuse pooled HTTPS connections
+SESSION = requests.Session()
+SESSION.headers.update({
+    "accept": "application/json",
+    "authorization": f"Bearer {API_KEY}"
+})
+SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=MAX_WORKERS))
+
 
 def load_yaml_file(file_path: Path) -> Optional[str]:
     """Load YAML file content if it exists."""
@@ -26,19 +51,54 @@ def yaml_has_changed(existing_yaml: str, new_yaml: str) -> bool:
     return existing_yaml != new_yaml
 
 
-def get_pipeline_yaml(workspace_name: str, pipeline_name: str) -> Tuple[bool, Optional[Dict]]:
-    """Get pipeline YAML from deepset cloud. Returns (success, response_data)."""
-    url = f"{API_URL}/api/v1/workspaces/{workspace_name}/pipelines/{pipeline_name}/yaml"
+def _remote_cache_path(workspace_name: str, pipeline_name: str) -> Path:
+    """Get the path of the cached remote YAML for a pipeline."""
+    return REMOTE_CACHE_DIR / workspace_name / f"{pipeline_name}.json"
 
-    headers = {
-        "accept": "application/json",
-        "authorization": f"Bearer {API_KEY}"
-    }
 
-    response = requests.get(url, headers=headers)
+def _load_remote_cache(workspace_name: str, pipeline_name: str) -> Optional[Dict]:
+    """Load the cached remote YAML and its ETag, if any."""
+    cache_path = _remote_cache_path(workspace_name, pipeline_name)
+    if not cache_path.exists():
+        return None
+    try:
+        return json.loads(cache_path.read_text())
+    except json.JSONDecodeError:
+        logger.warning(f"Ignoring invalid cache file: {cache_path}")
+        return None
 
-    if response.status_code == 200:
-        return True, response.json()
+
+def _save_remote_cache(workspace_name: str, pipeline_name: str, etag: str, data: Dict) -> None:
+    """Cache the remote YAML together with the ETag it was served with."""
+    cache_path = _remote_cache_path(workspace_name, pipeline_name)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps({"etag": etag, "data": data}))
+
+
+def get_pipeline_yaml(workspace_name: str, pipeline_name: str) -> Tuple[bool, Optional[Dict]]:
+    """Get pipeline YAML from deepset cloud. Returns (success, response_data).
+
+    If the YAML was fetched before and the API sent an ETag, a conditional request is made.
+    When the API answers with 304 Not Modified, the cached YAML is returned without transferring it again.
+    """
+    url = f"{API_URL}/api/v1/workspaces/{workspace_name}/pipelines/{pipeline_name}/yaml"
+
+    headers = {}
+    cached = _load_remote_cache(workspace_name, pipeline_name)
+    if cached is not None:
+        headers["If-None-Match"] = cached["etag"]
+
+    response = SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+
+    if response.status_code == 304 and cached is not None:
+        logger.info(f"Pipeline {workspace_name}/{pipeline_name} not modified since last fetch, using cached YAML")
+        return True, cached["data"]
+    elif response.status_code == 200:
+        data = orjson.loads(response.content)
+        etag = response.headers.get("ETag")
+        if etag:
+            _save_remote_cache(workspace_name, pipeline_name, etag, data)
+        return True, data
     elif response.status_code == 404:
         logger.info(f"Pipeline {workspace_name}/{pipeline_name} does not exist in deepset Cloud")
         return False, None
@@ -58,13 +118,7 @@ def create_pipeline(workspace_name: str, query_yaml: str, indexing_yaml: str, pi
         "name": pipeline_name,
     }
 
-    headers = {
-        "accept": "application/json",
-        "content-type": "application/json",
-        "authorization": f"Bearer {API_KEY}"
-    }
-
-    response = requests.post(url, json=payload, headers=headers)
+    response = SESSION.post(url, data=orjson.dumps(payload), headers=JSON_CONTENT_TYPE, timeout=REQUEST_TIMEOUT)
 
     if response.status_code in [200, 201]:
         logger.info(f"Successfully created pipeline {workspace_name}/{pipeline_name}")
@@ -84,13 +138,7 @@ def update_pipeline(workspace_name: str, pipeline_name: str, query_yaml: str, in
         "indexing_yaml": indexing_yaml
     }
 
-    headers = {
-        "accept": "application/json",
-        "content-type": "application/json",
-        "authorization": f"Bearer {API_KEY}"
-    }
-
-    response = requests.put(url, json=payload, headers=headers)
+    response = SESSION.put(url, data=orjson.dumps(payload), headers=JSON_CONTENT_TYPE, timeout=REQUEST_TIMEOUT)
 
     if response.status_code == 200:
         logger.info(f"Successfully updated pipeline {workspace_name}/{pipeline_name}")
@@ -117,7 +165,7 @@ def process_local_pipeline(workspace: str, pipeline_name: str, query_yaml_path:
     # If indexing YAML is not found, use a default empty pipeline
     if not indexing_yaml:
         logger.warning(f"Indexing YAML not found for {workspace}/{pipeline_name}. Using empty pipeline.")
-        indexing_yaml = "# Empty Pipeline"
+        indexing_yaml = EMPTY_PIPELINE_YAML
 
     # Check if pipeline exists in deepset Cloud
     exists, remote_data = get_pipeline_yaml(workspace, pipeline_name)
@@ -149,9 +197,6 @@ def main() -> int:
     Returns:
         int: 0 if successful, 1 if any errors occurred
     """
-    # Track if any errors occurred
-    has_errors = False
-
     # Check if API token is available
     if not API_KEY:
         logger.error("DP_API_KEY environment variable is not set")
@@ -164,33 +209,46 @@ def main() -> int:
         logger.error(f"Pipelines directory not found: {pipelines_dir}")
         return 1
 
-    # Iterate through workspace directories
-    for workspace_dir in pipelines_dir.iterdir():
-        if not workspace_dir.is_dir():
-            continue
-
-        workspace_name = workspace_dir.name
-        logger.info(f"Processing workspace: {workspace_name}")
+    # Collect all pipelines first, so they can be synced concurrently
+    jobs: List[Tuple[str, str, Path, Path]] = []
 
-        # Iterate through pipeline directories
-        for pipeline_dir in workspace_dir.iterdir():
-            if not pipeline_dir.is_dir():
+    # Iterate through workspace directories; os.scandir serves is_dir() from the directory entry without a stat call
+    with os.scandir(pipelines_dir) as workspace_entries:
+        for workspace_entry in workspace_entries:
+            if not workspace_entry.is_dir():
                 continue
 
-            pipeline_name = pipeline_dir.name
-            logger.info(f"Processing pipeline: {pipeline_name}")
+            workspace_name = workspace_entry.name
+            logger.info(f"Processing workspace: {workspace_name}")
+
+            # Iterate through pipeline directories
+            with os.scandir(workspace_entry.path) as pipeline_entries:
+                for pipeline_entry in pipeline_entries:
+                    if not pipeline_entry.is_dir():
+                        continue
+
+                    pipeline_name = pipeline_entry.name
+                    logger.info(f"Processing pipeline: {pipeline_name}")
+
+                    # Define paths to YAML files
+                    pipeline_dir = Path(pipeline_entry.path)
+                    query_yaml_path = pipeline_dir / "query.yml"
+                    indexing_yaml_path = pipeline_dir / "indexing.yml"
+
+                    jobs.append((workspace_name, pipeline_name, query_yaml_path, indexing_yaml_path))
+
+    def run_job(job: Tuple[str, str, Path, Path]) -> bool:
+        workspace_name, pipeline_name, query_yaml_path, indexing_yaml_path = job
+        try:
+            return process_local_pipeline(workspace_name, pipeline_name, query_yaml_path, indexing_yaml_path)
+        except Exception as e:
+            logger.error(f"Error processing pipeline {workspace_name}/{pipeline_name}: {str(e)}")
+            return False
 
-            # Define paths to YAML files
-            query_yaml_path = pipeline_dir / "query.yml"
-            indexing_yaml_path = pipeline_dir / "indexing.yml"
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(run_job, jobs))
 
-            try:
-                success = process_local_pipeline(workspace_name, pipeline_name, query_yaml_path, indexing_yaml_path)
-                if not success:
-                    has_errors = True
-            except Exception as e:
-                logger.error(f"Error processing pipeline {workspace_name}/{pipeline_name}: {str(e)}")
-                has_errors = True
+    has_errors = not all(results)
 
     if has_errors:
         logger.error("One or more errors occurred during processing")
@@ -1,17 +1,28 @@
-import yaml
+from __future__ import annotations
+
+import json
+import hashlib
 import logging
 from pathlib import Path
-from typing import Dict, Optional, Any
-
-from haystack import Pipeline
-from dotenv import load_dotenv
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Any, Tuple, Union
 
-load_dotenv()
+# Haystack and PyYAML are imported where they are used, so importing this module stays cheap
+if TYPE_CHECKING:
+    from haystack import Pipeline
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Serialized pipelines are cached here, keyed by a hash of the pipeline definition
+CACHE_DIR = Path(".cache") / "pipelines"
+# Bump when the layout produced by prepare_yaml_string changes, so stale cache entries are not reused
+YAML_FORMAT_VERSION = 2
+
+# In-process memo of prepared YAML by pipeline object or factory, shared by all callers of prepare_yaml_string
+# (e.g. test_pipeline_serialization.py). The object is stored with its YAML, so a recycled id() never matches.
+_yaml_memo: Dict[int, Tuple[Union[Pipeline, Callable[[], Pipeline]], str]] = {}
+
 
 def load_yaml_if_exists(file_path: Path) -> Optional[str]:
     """
@@ -50,27 +61,85 @@ def yaml_has_changed(existing_yaml: Optional[str], new_yaml: str) -> bool:
     return existing_yaml != new_yaml
 
 
-def prepare_yaml_string(pipeline: Optional[Pipeline]) -> str:
+def pipeline_cache_key(pipeline_dict: Dict[str, Any]) -> str:
+    """
+    Compute a content-addressed cache key for a serialized pipeline.
+
+    The Haystack version and the YAML format version are part of the key, so changing either invalidates the cache.
+
+    :param pipeline_dict: The pipeline as returned by `Pipeline.to_dict()`
+    :return: Hex digest identifying the pipeline definition
+    """
+    from haystack.version import __version__ as haystack_version
+
+    payload = json.dumps(pipeline_dict, sort_keys=True, default=str)
+    return hashlib.sha256(f"{haystack_version}\n{YAML_FORMAT_VERSION}\n{payload}".encode()).hexdigest()
+
+
+def prepare_yaml_string(
+    pipeline: Union[Pipeline, Callable[[], Pipeline], None],
+    cache_dir: Optional[Path] = CACHE_DIR,
+    write_cache: bool = True,
+) -> str:
     """
     Convert a pipeline object to a YAML string.
 
-    :param pipeline: The pipeline object to convert or None
+    Pipeline configs may give a factory instead of a pipeline, which is called here.
+
+    A pipeline that was already prepared in this process is not serialized again.
+    If a cache directory is given, YAML produced for an identical pipeline definition in a previous run
+    is reused as well. The cache key is derived from `to_dict()`, so a disk cache hit only skips the YAML dump.
+
+    :param pipeline: The pipeline object to convert, a function building it, or None
+    :param cache_dir: Directory for cached YAML strings; pass None to disable caching
+    :param write_cache: Whether to store newly produced YAML in the cache directory; pass False to only read it
     :return: The YAML representation of the pipeline
     """
     if pipeline is None:
         return "# Empty Pipeline"
 
+    # Memoized on what the config holds, so a factory is only called once per process
+    source = pipeline
+    memo = _yaml_memo.get(id(source))
+    if memo is not None and memo[0] is source:
+        return memo[1]
+
+    if callable(pipeline):
+        pipeline = pipeline()
+
+    pipeline_dict = pipeline.to_dict()
+
+    cache_file = None
+    if cache_dir is not None:
+        cache_file = cache_dir / f"{pipeline_cache_key(pipeline_dict)}.yml"
+        cached_yaml = load_yaml_if_exists(cache_file)
+        if cached_yaml is not None:
+            logger.info(f"Using cached YAML: {cache_file}")
+            _yaml_memo[id(source)] = (source, cached_yaml)
+            return cached_yaml
+
     # Handle dAP specific additions to Haystack pipeline yaml
     inputs = pipeline.metadata.get("inputs", {})
     outputs = pipeline.metadata.get("outputs", {})
 
-    pipeline_yaml = pipeline.dumps()
+    import yaml
+    from haystack.marshal import YamlMarshaller
+
+    # Equivalent to pipeline.dumps(), without calling to_dict() a second time
+    pipeline_yaml = YamlMarshaller().marshal(pipeline_dict)
+
+    # The dAP keys are new top-level keys, so they can be appended as text
+    # instead of parsing and re-dumping the whole pipeline YAML.
+    dap_yaml = yaml.dump({"inputs": inputs, "outputs": outputs}, default_flow_style=False)
 
-    pipeline_yaml_dict = yaml.safe_load(pipeline_yaml)
-    pipeline_yaml_dict["inputs"] = inputs
-    pipeline_yaml_dict["outputs"] = outputs
+    result = pipeline_yaml + dap_yaml
 
-    return yaml.dump(pipeline_yaml_dict, default_flow_style=False)
+    if cache_file is not None and write_cache:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(result)
+
+    _yaml_memo[id(source)] = (source, result)
+    return result
 
 
 def process_pipeline(pipeline_dict: Dict[str, Any]) -> bool:
@@ -130,6 +199,9 @@ def main() -> bool:
 
 
 if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
     errors = main()
     # Exit with status code 1 if changes were made, so the GitHub Action knows to commit them
     if errors:
@@ -1,5 +1,7 @@
 import logging
 
+from serialize_pipelines import prepare_yaml_string
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -24,8 +26,8 @@ def main():
         if query_pipeline:
             try:
                 logger.info(f"Testing serialization of {workspace}/{name} query pipeline")
-                # Test if serialization works, store result for validation but don't use it
-                _ = query_pipeline.dumps()
+                # Serialize exactly like serialize_pipelines.py does, without writing to the cache
+                prepare_yaml_string(query_pipeline, write_cache=False)
                 logger.info(f"Successfully serialized {workspace}/{name} query pipeline")
             except Exception as e:
                 logger.error(f"Error serializing {workspace}/{name} query pipeline: {str(e)}")
@@ -36,8 +38,8 @@ def main():
         if indexing_pipeline:
             try:
                 logger.info(f"Testing serialization of {workspace}/{name} indexing pipeline")
-                # Test if serialization works, store result for validation but don't use it
-                _ = indexing_pipeline.dumps()
+                # Serialize exactly like serialize_pipelines.py does, without writing to the cache
+                prepare_yaml_string(indexing_pipeline, write_cache=False)
                 logger.info(f"Successfully serialized {workspace}/{name} indexing pipeline")
             except Exception as e:
                 logger.error(f"Error serializing {workspace}/{name} indexing pipeline: {str(e)}")
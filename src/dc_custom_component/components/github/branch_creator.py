@@ -1,13 +1,37 @@
 import re
 from typing import Any, Dict, Optional
 
+import orjson
 import requests
 from haystack import component, default_from_dict, default_to_dict, logging
 from haystack.utils import deserialize_secrets_inplace
 from haystack.utils.auth import Secret
 
+from dc_custom_component.components.github.retry import get_session
+
 logger = logging.getLogger(__name__)
 
+ISSUE_URL_PATTERN = re.compile(r"https?://github\.com/([^/]+)/([^/]+)/issues/(\d+)")
+
+REPOS_URL = "https://api.github.com/repos"
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Fetches the default branch head and checks whether the new branch exists in a single
+# request
+BRANCH_STATE_QUERY = """
+query($owner: String!, $repo: String!, $branch: String!) {
+  repository(owner: $owner, name: $repo) {
+    defaultBranchRef {
+      name
+      target { oid }
+    }
+    ref(qualifiedName: $branch) {
+      target { oid }
+    }
+  }
+}
+"""
+
 
 @component
 class GithubBranchCreator:
@@ -51,7 +75,7 @@ class GithubBranchCreator:
         :param github_token: GitHub personal access token with repo scope for API authentication
         :param fail_if_exists: If True, raises exception when branch already exists; if False, skips creation
         :param branch_prefix: Prefix to use for branch names (default: "fix-issue-")
-        :param retry_attempts: Number of retry attempts for failed requests
+        :param retry_attempts: Number of retry attempts for connection errors, 429 and 5xx responses
         """
         self.github_token = github_token
         self.fail_if_exists = fail_if_exists
@@ -63,16 +87,18 @@ class GithubBranchCreator:
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "Haystack/GithubBranchCreator",
         }
+        self._request_headers = {
+            **self.headers,
+            "Authorization": f"Bearer {self.github_token.resolve_value()}",
+        }
 
-    def _get_request_headers(self) -> dict:
-        """
-        Get headers with resolved token for the request.
+        # (connect, read) timeouts in seconds, so a stalled connection cannot hang the
+        # pipeline
+        self._timeout = (5.0, 15.0)
 
-        :return: Dictionary of headers including authorization
-        """
-        headers = self.headers.copy()
-        headers["Authorization"] = f"Bearer {self.github_token.resolve_value()}"
-        return headers
+        # A replayed POST is safe: the branch state query is read-only, and a replayed ref
+        # creation is rejected with 422 and recovered from in _create_branch
+        self._session = get_session(retry_attempts, allowed_methods=["GET", "POST"])
 
     def _parse_github_url(self, url: str) -> tuple[str, str, int]:
         """
@@ -82,97 +108,121 @@ class GithubBranchCreator:
         :return: Tuple of (owner, repo, issue_number)
         :raises ValueError: If URL format is invalid
         """
-        pattern = r"https?://github\.com/([^/]+)/([^/]+)/issues/(\d+)"
-        match = re.match(pattern, url)
+        match = ISSUE_URL_PATTERN.match(url)
         if not match:
             raise ValueError(f"Invalid GitHub issue URL format: {url}")
 
         owner, repo, issue_number = match.groups()
         return owner, repo, int(issue_number)
 
-    def _get_default_branch(self, owner: str, repo: str) -> str:
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a query against the GitHub GraphQL API.
+
+        :param query: GraphQL query string
+        :param variables: Variables referenced by the query
+        :return: The "data" object of the response
+        :raises RuntimeError: If the response contains GraphQL errors
+        """
+        response = self._session.post(
+            GRAPHQL_URL,
+            json={"query": query, "variables": variables},
+            headers=self._request_headers,
+            timeout=self._timeout,
+        )
+        response.raise_for_status()
+        body = orjson.loads(response.content)
+        if body.get("errors"):
+            raise RuntimeError(f"GitHub GraphQL query failed: {body['errors']}")
+        return body["data"]  # type: ignore
+
+    def _get_branch_state(
+        self, owner: str, repo: str, branch_name: str
+    ) -> tuple[str, Optional[str]]:
         """
-        Get the default branch of the repository.
+        Get the head of the default branch and the head of the branch to create in a single request.
 
         :param owner: Repository owner
         :param repo: Repository name
-        :return: The name of the default branch
+        :param branch_name: Name of the branch to create
+        :return: Tuple of (SHA of the default branch head, SHA of the branch head or None if it does not exist)
+        :raises ValueError: If the repository or its default branch cannot be found
         """
-        url = f"https://api.github.com/repos/{owner}/{repo}"
-
-        for attempt in range(self.retry_attempts + 1):
-            try:
-                response = requests.get(url, headers=self._get_request_headers())
-                response.raise_for_status()
-                return response.json()["default_branch"]  # type: ignore
-            except Exception as e:
-                if attempt == self.retry_attempts:
-                    raise
-                logger.warning(f"Failed to get default branch, retrying: {str(e)}")
-
-        # This should never be reached, but added for type safety
-        raise RuntimeError("Failed to get default branch after retries")
+        data = self._graphql(
+            BRANCH_STATE_QUERY,
+            {"owner": owner, "repo": repo, "branch": f"refs/heads/{branch_name}"},
+        )
+        repository = data.get("repository") or {}
+        branch_ref = repository.get("defaultBranchRef")
+        if not branch_ref:
+            raise ValueError(f"Could not find default branch in {owner}/{repo}")
+
+        existing_ref = repository.get("ref")
+        return branch_ref["target"]["oid"], (
+            existing_ref["target"]["oid"] if existing_ref else None
+        )
 
-    def _get_branch_ref(self, owner: str, repo: str, branch: str) -> Optional[str]:
+    def _get_branch_ref(self, repo_url: str, branch: str) -> Optional[str]:
         """
         Check if a branch exists in the repository.
 
-        :param owner: Repository owner
-        :param repo: Repository name
+        :param repo_url: REST API URL of the repository
         :param branch: Branch name to check
         :return: SHA of the branch head if it exists, None otherwise
         """
-        url = f"https://api.github.com/repos/{owner}/{repo}/git/refs/heads/{branch}"
+        url = f"{repo_url}/git/refs/heads/{branch}"
 
         try:
-            response = requests.get(url, headers=self._get_request_headers())
+            response = self._session.get(
+                url, headers=self._request_headers, timeout=self._timeout
+            )
             if response.status_code == 404:
                 return None
             response.raise_for_status()
-            return response.json()["object"]["sha"]  # type: ignore
+            return orjson.loads(response.content)["object"]["sha"]  # type: ignore
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
                 return None
             raise
 
-    def _create_branch(
-        self, owner: str, repo: str, branch_name: str, base_sha: str
-    ) -> bool:
+    def _create_branch(self, repo_url: str, branch_name: str, base_sha: str) -> bool:
         """
         Create a new branch in the repository.
 
-        :param owner: Repository owner
-        :param repo: Repository name
+        :param repo_url: REST API URL of the repository
         :param branch_name: Name for the new branch
         :param base_sha: SHA of the commit to base the branch on
-        :return: True if branch was created, False if it already existed
+        :return: True once the branch was created
         """
-        # Check if branch already exists
-        if self._get_branch_ref(owner, repo, branch_name):
-            if self.fail_if_exists:
-                raise ValueError(
-                    f"Branch '{branch_name}' already exists in {owner}/{repo}"
-                )
-            return False
-
-        # Create the branch
-        url = f"https://api.github.com/repos/{owner}/{repo}/git/refs"
+        url = f"{repo_url}/git/refs"
         payload = {"ref": f"refs/heads/{branch_name}", "sha": base_sha}
-
-        for attempt in range(self.retry_attempts + 1):
-            try:
-                response = requests.post(
-                    url, json=payload, headers=self._get_request_headers()
+        try:
+            response = self._session.post(
+                url, json=payload, headers=self._request_headers, timeout=self._timeout
+            )
+            response.raise_for_status()
+            return True
+        except requests.exceptions.ConnectTimeout:
+            raise
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            requests.exceptions.HTTPError,
+        ) as e:
+            # A POST that timed out while reading may still have created the ref, in
+            # which case its retry fails with 422. Check whether the branch now points
+            # at base_sha.
+            if (
+                isinstance(e, requests.exceptions.HTTPError)
+                and e.response.status_code != 422
+            ):
+                raise
+            if self._get_branch_ref(repo_url, branch_name) == base_sha:
+                logger.warning(
+                    f"Branch '{branch_name}' was created despite an incomplete response: {str(e)}"
                 )
-                response.raise_for_status()
                 return True
-            except Exception as e:
-                if attempt == self.retry_attempts:
-                    raise
-                logger.warning(f"Failed to create branch, retrying: {str(e)}")
-
-        # This should never be reached, but added for type safety
-        raise RuntimeError("Failed to create branch after retries")
+            raise
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -214,17 +264,19 @@ class GithubBranchCreator:
         # Generate branch name
         branch_name = f"{self.branch_prefix}{issue_number}"
 
-        # Get the default branch to use as base
-        default_branch = self._get_default_branch(owner, repo)
-
-        # Get the SHA of the latest commit on default branch
-        base_sha = self._get_branch_ref(owner, repo, default_branch)
-        if not base_sha:
-            raise ValueError(
-                f"Could not find default branch '{default_branch}' in {owner}/{repo}"
-            )
+        # Get the SHA of the latest commit on the default branch and check if the branch
+        # already exists
+        base_sha, existing_sha = self._get_branch_state(owner, repo, branch_name)
+        if existing_sha:
+            if self.fail_if_exists:
+                raise ValueError(
+                    f"Branch '{branch_name}' already exists in {owner}/{repo}"
+                )
+            return {"branch_name": branch_name, "created": False}
 
         # Create the branch
-        created = self._create_branch(owner, repo, branch_name, base_sha)
+        created = self._create_branch(
+            f"{REPOS_URL}/{owner}/{repo}", branch_name, base_sha
+        )
 
         return {"branch_name": branch_name, "created": created}
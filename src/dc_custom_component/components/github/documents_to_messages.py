@@ -46,7 +46,9 @@ class DocumentToChatMessageConverter:
         """
         Initialize the component.
 
-        :param assistant_pattern: Regex pattern that if matched will make the document an assistant message
+        :param assistant_pattern: Regex pattern that if matched will make the document an assistant message.
+            The pattern is searched anywhere in the content; anchor it with "^" (e.g. r"^Assistant:") to only check
+            the start, which also keeps the search from scanning long documents.
         :param strip_role_prefix: If True, removes role prefixes from content (e.g., "Assistant: ")
         """
 
@@ -54,42 +56,6 @@ class DocumentToChatMessageConverter:
 
         self.strip_role_prefix = strip_role_prefix
 
-    def _clean_content(self, content: str) -> str:
-        """
-        Clean content by removing role prefixes if strip_role_prefix is enabled.
-
-        :param content: Content string to clean
-        :return: Cleaned content string
-        """
-        if not self.strip_role_prefix:
-            return content
-
-        # Find the first match of the pattern
-        if isinstance(self.assistant_pattern, re.Pattern):
-            match = self.assistant_pattern.search(content)
-            if match:
-                # Remove the matched prefix part
-                return content[match.end() :].lstrip()
-
-        return content
-
-    def _create_chat_message(self, document: Document) -> ChatMessage:
-        """
-        Create a ChatMessage from a Document.
-
-        :param document: Source Document
-        :return: Converted ChatMessage
-        """
-        content = document.content or ""
-
-        # Check if content matches the assistant pattern
-        if self.assistant_pattern and self.assistant_pattern.search(content):
-            cleaned_content = self._clean_content(content)
-            return ChatMessage.from_assistant(cleaned_content, meta=document.meta)
-        else:
-            # Default to user role
-            return ChatMessage.from_user(content, meta=document.meta)
-
     @component.output_types(messages=List[ChatMessage])
     def run(self, documents: List[Document]) -> Dict[str, List[ChatMessage]]:
         """
@@ -98,5 +64,25 @@ class DocumentToChatMessageConverter:
         :param documents: List of Documents to convert
         :return: Dictionary containing list of ChatMessages
         """
-        chat_messages = [self._create_chat_message(doc) for doc in documents]
+        # Hoisted out of the loop, which runs once per document
+        pattern = self.assistant_pattern
+        strip = self.strip_role_prefix
+        from_assistant = ChatMessage.from_assistant
+        from_user = ChatMessage.from_user
+
+        chat_messages = []
+        for doc in documents:
+            content = doc.content or ""
+
+            # A single search decides the role and, if enabled, where the role prefix
+            # ends
+            match = pattern.search(content) if pattern else None
+            if match is None:
+                chat_messages.append(from_user(content, meta=doc.meta))
+                continue
+
+            if strip:
+                content = content[match.end() :].lstrip()
+            chat_messages.append(from_assistant(content, meta=doc.meta))
+
         return {"messages": chat_messages}
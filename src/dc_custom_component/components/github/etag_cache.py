@@ -0,0 +1,49 @@
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+# Maximum number of responses kept per component for conditional requests; the least
+# recently used entry is evicted first
+ETAG_CACHE_MAX_ENTRIES = 256
+
+
+class ETagCache:
+    """
+    Bounded in-memory cache of GitHub API responses for conditional requests.
+
+    Maps a request URL to its ETag and parsed response, so unchanged content can be revalidated with
+    `If-None-Match` and answered by a bodiless 304. Safe to use from several threads.
+    """
+
+    def __init__(self, max_entries: int = ETAG_CACHE_MAX_ENTRIES) -> None:
+        """
+        Create an empty cache.
+
+        :param max_entries: Maximum number of responses kept
+        """
+        self.max_entries = max_entries
+        self._entries: Dict[str, Tuple[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[Tuple[str, Any]]:
+        """
+        Get the cached ETag and parsed response for a URL.
+
+        :param url: Request URL
+        :return: Tuple of ETag and parsed response, or None if the URL is not cached
+        """
+        return self._entries.get(url)
+
+    def put(self, url: str, etag: str, data: Any) -> None:
+        """
+        Store or refresh the response for a URL, evicting the least recently used entry when full.
+
+        :param url: Request URL
+        :param etag: ETag returned with the response
+        :param data: Parsed response
+        """
+        with self._lock:
+            # Re-inserting moves the URL to the end, so the first key is the least recently used
+            self._entries.pop(url, None)
+            if len(self._entries) >= self.max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._entries[url] = (etag, data)
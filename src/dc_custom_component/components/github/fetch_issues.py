@@ -1,6 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
-
 from haystack import (
     SuperComponent,
     component,
@@ -38,6 +38,10 @@ class FetchIssue(SuperComponent):
             github_token=self.github_token, fail_if_exists=False
         )
 
+        self._fetcher = fetcher
+        self._converter = converter
+        self._branch_creator = creator
+
         pp = Pipeline()
         pp.add_component("branch_creator", creator)
         pp.add_component("fetcher", fetcher)
@@ -53,6 +57,25 @@ class FetchIssue(SuperComponent):
             },
         )
 
+    def run(self, **kwargs: Any) -> dict[str, Any]:
+        """
+        Create the branch for an issue and fetch the issue as chat messages.
+
+        Branch creation and fetching the issue depend on nothing but the URL, so both requests run concurrently
+        instead of one after the other as the wrapped pipeline would run them.
+
+        :param kwargs: The `url` of the GitHub issue, as declared by the wrapped pipeline's inputs
+        :return: Dictionary containing the branch name and the issue messages
+        """
+        url = kwargs["url"]
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            fetched = executor.submit(self._fetcher.run, url=url)
+            branch = self._branch_creator.run(url=url)
+            documents = fetched.result()["documents"]
+
+        messages = self._converter.run(documents=documents)["messages"]
+        return {"branch": branch["branch_name"], "messages": messages}
+
     def to_dict(self) -> dict[str, Any]:
         """
         Serialize the component to a dictionary.
@@ -79,4 +102,5 @@ class FetchIssue(SuperComponent):
         return default_from_dict(cls, data)  # type: ignore
 
 
-# url > fetch issue / create branch > branch, messages > Agent > messages, branch > create PR
+# url > fetch issue / create branch > branch, messages > Agent > messages, branch >
+# create PR
@@ -1,12 +1,38 @@
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import StrEnum
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 import requests
 from haystack import component, logging, default_from_dict, default_to_dict
 from haystack.utils import Secret, deserialize_secrets_inplace
-from base64 import b64encode, b64decode
+from base64 import b64encode
+
+from dc_custom_component.components.github.retry import get_session
 
 logger = logging.getLogger(__name__)
 
+# Shared by all editor instances so consecutive calls reuse keep-alive connections to
+# api.github.com. Only reads are retried: a PUT or DELETE that was applied but answered
+# with a 5xx would otherwise be replayed, and the replay's 409 on the stale sha would
+# make _edit_file apply the edit a second time.
+_SESSION = get_session(3, allowed_methods=frozenset({"GET", "HEAD"}))
+
+# Seconds a fetched file stays cached, so repeated edits of one file skip the GET. After
+# that the file is revalidated with its ETag; a 304 is cheap and does not count against
+# the rate limit.
+FILE_CACHE_TTL = 60.0
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+CREATE_COMMIT_MUTATION = """
+mutation($input: CreateCommitOnBranchInput!) {
+  createCommitOnBranch(input: $input) {
+    commit { oid }
+  }
+}
+"""
+
 
 class Command(StrEnum):
     """Available commands for file operations in GitHub.
@@ -67,9 +93,35 @@ class GithubFileEditor:
             "message": "Renamed function for clarity"
         }
     )
+
+    # Apply several changes as one commit
+    result = editor.run_batch(
+        commands=[
+            {"command": "edit", "payload": {"path": "a.py", "original": "old", "replacement": "new"}},
+            {"command": "delete", "payload": {"path": "b.py"}},
+        ],
+        message="Replace b.py by an edit to a.py",
+    )
     ```
     """
 
+    # Handler method per command, looked up by name so it can be overridden or patched
+    # per instance
+    _COMMAND_HANDLERS: Dict[Command, str] = {
+        Command.EDIT: "_edit_file",
+        Command.UNDO: "_undo_changes",
+        Command.CREATE: "_create_file",
+        Command.DELETE: "_delete_file",
+    }
+
+    # Payload keys each command needs in run_batch, which takes the commit message
+    # separately
+    _BATCH_PAYLOAD_KEYS: Dict[Command, tuple[str, ...]] = {
+        Command.EDIT: ("path", "original", "replacement"),
+        Command.CREATE: ("path", "content"),
+        Command.DELETE: ("path",),
+    }
+
     def __init__(
         self,
         github_token: Secret = Secret.from_env_var("GITHUB_TOKEN", strict=False),
@@ -98,18 +150,112 @@ class GithubFileEditor:
             "Authorization": f"Bearer {self.github_token.resolve_value()}",
             "User-Agent": "Haystack/GithubFileEditor",
         }
+        # Raw media type: file bytes in the body instead of base64 inside JSON
+        self._raw_headers = {
+            **self.headers,
+            "Accept": "application/vnd.github.raw+json",
+        }
+        self._session = _SESSION
+        # (connect, read) timeouts in seconds, so a stalled connection cannot hang the
+        # pipeline
+        self._timeout = (5.0, 30.0)
+
+        # (owner, repo, path, branch) -> (expiry, content, sha, etag) of files read or
+        # written by this editor
+        self._file_cache: Dict[
+            tuple[str, str, str, str], tuple[float, str, str, Optional[str]]
+        ] = {}
+
+        # Login of the token's user, looked up on the first undo
+        self._current_user: Optional[str] = None
+
+    def close(self) -> None:
+        """
+        Drop the files cached by this editor.
+
+        The pooled session is shared by all editors, so it is left open for the others.
+        """
+        self._file_cache.clear()
+
+    def __enter__(self) -> "GithubFileEditor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _cache_file(
+        self,
+        owner: str,
+        repo: str,
+        path: str,
+        branch: str,
+        content: str,
+        sha: str,
+        etag: Optional[str] = None,
+    ) -> None:
+        """Remember the content and SHA of a file for FILE_CACHE_TTL seconds, and its ETag for revalidation."""
+        self._file_cache[(owner, repo, path, branch)] = (
+            time.monotonic() + FILE_CACHE_TTL,
+            content,
+            sha,
+            etag,
+        )
+
+    def _has_fresh_cache(self, owner: str, repo: str, path: str, branch: str) -> bool:
+        """Check whether the next read of a file is served from the cache without a request."""
+        cached = self._file_cache.get((owner, repo, path, branch))
+        return cached is not None and cached[0] > time.monotonic()
+
+    def _expire_cache(self, owner: str, repo: str, path: str, branch: str) -> None:
+        """Make the next read of a file revalidate its cached copy with GitHub."""
+        key = (owner, repo, path, branch)
+        cached = self._file_cache.get(key)
+        if cached is not None:
+            self._file_cache[key] = (0.0, *cached[1:])
+
+    @staticmethod
+    def _split_at_original(content: str, original: str) -> List[str]:
+        """Split content at original, at most twice so the file is scanned once; two parts mean it is unique."""
+        return content.split(original, 2) if original else []
+
+    def _invalidate_cache(self, owner: str, repo: str, branch: str) -> None:
+        """Drop all cached files of a branch."""
+        for key in [
+            k
+            for k in self._file_cache
+            if k[0] == owner and k[1] == repo and k[3] == branch
+        ]:
+            del self._file_cache[key]
 
     def _get_file_content(
         self, owner: str, repo: str, path: str, branch: str
     ) -> tuple[str, str]:
         """Get file content and SHA from GitHub."""
+        cached = self._file_cache.get((owner, repo, path, branch))
+        if cached and cached[0] > time.monotonic():
+            return cached[1], cached[2]
+
         url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}"
         params: dict[str, str] = {"ref": branch}
-        response = requests.get(url, headers=self.headers, params=params)
+        headers = self._raw_headers
+        if cached and cached[3]:
+            headers = {**self._raw_headers, "If-None-Match": cached[3]}
+        response = self._session.get(
+            url, headers=headers, params=params, timeout=self._timeout
+        )
+        if cached and response.status_code == 304:
+            self._cache_file(owner, repo, path, branch, cached[1], cached[2], cached[3])
+            return cached[1], cached[2]
         response.raise_for_status()
-        data = response.json()
-        content = b64decode(data["content"]).decode("utf-8")
-        sha: str = data["sha"]
+        raw = response.content
+        content = raw.decode("utf-8")
+        # The raw response carries no SHA, but it is the git blob hash of the bytes
+        blob_hash = hashlib.sha1(b"blob %d\x00" % len(raw))
+        blob_hash.update(raw)
+        sha = blob_hash.hexdigest()
+        self._cache_file(
+            owner, repo, path, branch, content, sha, response.headers.get("ETag")
+        )
         return content, sha
 
     def _update_file(
@@ -130,54 +276,119 @@ class GithubFileEditor:
             "sha": sha,
             "branch": branch,
         }
-        response = requests.put(url, headers=self.headers, json=payload)
+        self._file_cache.pop((owner, repo, path, branch), None)
+        response = self._session.put(
+            url, headers=self.headers, json=payload, timeout=self._timeout
+        )
         response.raise_for_status()
+
+        # Keep the cache hot with the new blob SHA, so a follow-up edit needs no GET
+        new_sha = (response.json().get("content") or {}).get("sha")
+        if new_sha:
+            self._cache_file(owner, repo, path, branch, content, new_sha)
         return True
 
-    def _check_last_commit(self, owner: str, repo: str, branch: str) -> bool:
-        """Check if last commit was made by the current token user."""
+    def _get_current_user(self) -> str:
+        """Get the login of the token's user, which is fixed for the lifetime of the token."""
+        if self._current_user is None:
+            user_response = self._session.get(
+                "https://api.github.com/user",
+                headers=self.headers,
+                timeout=self._timeout,
+            )
+            user_response.raise_for_status()
+            self._current_user = user_response.json()["login"]
+        return self._current_user
+
+    def _check_last_commit(
+        self, owner: str, repo: str, branch: str
+    ) -> tuple[bool, List[Dict[str, Any]]]:
+        """
+        Check if last commit was made by the current token user.
+
+        Also returns the last two commits of the branch, so an undo needs no second request.
+        """
         url = f"https://api.github.com/repos/{owner}/{repo}/commits"
-        params_dict: dict[str, int | str] = {"per_page": 1, "sha": branch}
-        response = requests.get(url, headers=self.headers, params=params_dict)
-        response.raise_for_status()
-        last_commit = response.json()[0]
-        commit_author = last_commit["author"]["login"]
+        params_dict: dict[str, int | str] = {"per_page": 2, "sha": branch}
+
+        if self._current_user is None:
+            # The user lookup does not depend on the commits, so the first one overlaps
+            # with them
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                user_future = executor.submit(self._get_current_user)
+                response = self._session.get(
+                    url, headers=self.headers, params=params_dict, timeout=self._timeout
+                )
+                current_user = user_future.result()
+        else:
+            response = self._session.get(
+                url, headers=self.headers, params=params_dict, timeout=self._timeout
+            )
+            current_user = self._current_user
 
-        # Get current user
-        user_response = requests.get(
-            "https://api.github.com/user", headers=self.headers
-        )
-        user_response.raise_for_status()
-        current_user = user_response.json()["login"]
+        response.raise_for_status()
+        commits: List[Dict[str, Any]] = response.json()
+        commit_author = commits[0]["author"]["login"]
 
-        return bool(commit_author == current_user)
+        return bool(commit_author == current_user), commits
 
     def _edit_file(
         self, owner: str, repo: str, payload: Dict[str, str], branch: str
     ) -> str:
         """Handle file editing."""
         try:
-            content, sha = self._get_file_content(owner, repo, payload["path"], branch)
-
-            # Check if original string is unique
-            occurrences = content.count(payload["original"])
-            if occurrences == 0:
-                return "Error: Original string not found in file"
-            if occurrences > 1:
-                return "Error: Original string appears multiple times. Please provide more context"
-
-            # Perform the replacement
-            new_content = content.replace(payload["original"], payload["replacement"])
-            success = self._update_file(
-                owner,
-                repo,
-                payload["path"],
-                new_content,
-                payload["message"],
-                sha,
-                branch,
-            )
-            return "Edit successful" if success else "Edit failed"
+            # The PUT only succeeds if the file still has the SHA we read. If it changed
+            # in the meantime (409), re-read it and apply the edit once more to the
+            # current content.
+            for attempt in range(2):
+                from_cache = self._has_fresh_cache(owner, repo, payload["path"], branch)
+                content, sha = self._get_file_content(
+                    owner, repo, payload["path"], branch
+                )
+
+                # Check if original string is unique
+                parts = self._split_at_original(content, payload["original"])
+                if len(parts) != 2 and payload["original"] and from_cache:
+                    # The cached copy may be stale, e.g. after a push by someone else,
+                    # so check with GitHub before reporting the string as missing or
+                    # ambiguous
+                    self._expire_cache(owner, repo, payload["path"], branch)
+                    content, sha = self._get_file_content(
+                        owner, repo, payload["path"], branch
+                    )
+                    parts = self._split_at_original(content, payload["original"])
+                if len(parts) == 1:
+                    return "Error: Original string not found in file"
+                if len(parts) != 2:
+                    return "Error: Original string appears multiple times. Please provide more context"
+
+                # Perform the replacement
+                new_content = parts[0] + payload["replacement"] + parts[1]
+                try:
+                    success = self._update_file(
+                        owner,
+                        repo,
+                        payload["path"],
+                        new_content,
+                        payload["message"],
+                        sha,
+                        branch,
+                    )
+                except requests.HTTPError as e:
+                    if (
+                        attempt == 0
+                        and e.response is not None
+                        and e.response.status_code == 409
+                    ):
+                        logger.warning(
+                            f"File {payload['path']} changed while editing, retrying: {str(e)}"
+                        )
+                        continue
+                    raise
+                return "Edit successful" if success else "Edit failed"
+
+            # This should never be reached, but added for type safety
+            return "Edit failed"
 
         except requests.RequestException as e:
             if self.raise_on_failure:
@@ -189,24 +400,21 @@ class GithubFileEditor:
     ) -> str:
         """Handle undoing changes."""
         try:
-            if not self._check_last_commit(owner, repo, branch):
+            is_own_commit, commits = self._check_last_commit(owner, repo, branch)
+            if not is_own_commit:
                 return "Error: Last commit was not made by the current user"
 
             # Reset to previous commit
             url = f"https://api.github.com/repos/{owner}/{repo}/git/refs/heads/{branch}"
-            commits_url = f"https://api.github.com/repos/{owner}/{repo}/commits"
-
-            # Get the previous commit SHA
-            params_dict: dict[str, int | str] = {"per_page": 2, "sha": branch}
-            commits = requests.get(
-                commits_url, headers=self.headers, params=params_dict
-            ).json()
             previous_sha: str = commits[1]["sha"]
 
             # Update branch reference to previous commit
             update_payload: dict[str, str | bool] = {"sha": previous_sha, "force": True}
-            response = requests.patch(url, headers=self.headers, json=update_payload)
+            response = self._session.patch(
+                url, headers=self.headers, json=update_payload, timeout=self._timeout
+            )
             response.raise_for_status()
+            self._invalidate_cache(owner, repo, branch)
 
             return "Successfully undid last change"
 
@@ -225,7 +433,9 @@ class GithubFileEditor:
 
             data = {"message": payload["message"], "content": content, "branch": branch}
 
-            response = requests.put(url, headers=self.headers, json=data)
+            response = self._session.put(
+                url, headers=self.headers, json=data, timeout=self._timeout
+            )
             response.raise_for_status()
             return "File created successfully"
 
@@ -239,20 +449,213 @@ class GithubFileEditor:
     ) -> str:
         """Handle file deletion."""
         try:
-            content, sha = self._get_file_content(owner, repo, payload["path"], branch)
             url = f"https://api.github.com/repos/{owner}/{repo}/contents/{payload['path']}"
-
-            data = {"message": payload["message"], "sha": sha, "branch": branch}
-
-            response = requests.delete(url, headers=self.headers, json=data)
-            response.raise_for_status()
-            return "File deleted successfully"
+            # A SHA served from the cache may be stale (409); it is re-read once from
+            # GitHub and the delete is sent again
+            for attempt in range(2):
+                from_cache = self._has_fresh_cache(owner, repo, payload["path"], branch)
+                content, sha = self._get_file_content(
+                    owner, repo, payload["path"], branch
+                )
+
+                data = {"message": payload["message"], "sha": sha, "branch": branch}
+
+                self._file_cache.pop((owner, repo, payload["path"], branch), None)
+                response = self._session.delete(
+                    url, headers=self.headers, json=data, timeout=self._timeout
+                )
+                if response.status_code == 409 and attempt == 0 and from_cache:
+                    logger.warning(
+                        f"Cached SHA of {payload['path']} is stale, retrying the delete"
+                    )
+                    continue
+                response.raise_for_status()
+                return "File deleted successfully"
+
+            # This should never be reached, but added for type safety
+            return "Delete failed"
 
         except requests.RequestException as e:
             if self.raise_on_failure:
                 raise
             return f"Error: {str(e)}"
 
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a GraphQL request against the GitHub API and return its data."""
+        response = self._session.post(
+            GRAPHQL_URL,
+            headers=self.headers,
+            json={"query": query, "variables": variables},
+            timeout=self._timeout,
+        )
+        response.raise_for_status()
+        body = response.json()
+        if body.get("errors"):
+            raise requests.HTTPError(
+                f"GitHub GraphQL request failed: {body['errors']}", response=response
+            )
+        data: Dict[str, Any] = body["data"]
+        return data
+
+    def _get_branch_files(
+        self, owner: str, repo: str, branch: str, paths: List[str]
+    ) -> tuple[str, Dict[str, Optional[Dict[str, Any]]]]:
+        """Get the head commit of a branch and the blobs of several files on it in a single request."""
+        declarations = ["$owner: String!", "$repo: String!", "$ref: String!"]
+        selections = ["ref(qualifiedName: $ref) { target { oid } }"]
+        variables = {"owner": owner, "repo": repo, "ref": f"refs/heads/{branch}"}
+        for i, path in enumerate(paths):
+            declarations.append(f"$e{i}: String!")
+            selections.append(
+                f"f{i}: object(expression: $e{i}) {{ ... on Blob {{ text isBinary isTruncated }} }}"
+            )
+            variables[f"e{i}"] = f"{branch}:{path}"
+
+        query = (
+            f"query({', '.join(declarations)}) "
+            f"{{ repository(owner: $owner, name: $repo) {{ {' '.join(selections)} }} }}"
+        )
+        repository = self._graphql(query, variables)["repository"]
+        if not repository or not repository["ref"]:
+            raise ValueError(f"Branch '{branch}' not found in {owner}/{repo}")
+
+        blobs = {path: repository[f"f{i}"] for i, path in enumerate(paths)}
+        return repository["ref"]["target"]["oid"], blobs
+
+    def run_batch(
+        self,
+        commands: List[Dict[str, Any]],
+        message: str,
+        repo: Optional[str] = None,
+        branch: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """
+        Apply several edit, create and delete commands as a single commit.
+
+        All files are read in one GraphQL query and written with one createCommitOnBranch mutation,
+        which only succeeds if the branch head has not moved since it was read.
+
+        :param commands: List of {"command": ..., "payload": ...} dictionaries with the same payloads as run().
+            The per-command "message" is not used.
+        :param message: Commit message
+        :param repo: Repository in owner/repo format (overrides default if provided)
+        :param branch: Branch to commit to (overrides default if provided)
+        :return: Dictionary containing operation result
+        """
+        if repo is None:
+            if self.default_repo is None:
+                return {
+                    "result": "Error: No repository specified. Either provide it in initialization or in run_batch() method"
+                }
+            repo = self.default_repo
+
+        working_branch = branch if branch is not None else self.default_branch
+        owner, repo_name = repo.split("/")
+
+        parsed: List[tuple[Command, Dict[str, Any]]] = []
+        for entry in commands:
+            try:
+                cmd = Command(entry.get("command", ""))
+            except ValueError:
+                return {"result": f"Error: Unknown command '{entry.get('command')}'"}
+            if cmd == Command.UNDO:
+                return {"result": "Error: Command 'undo' cannot be batched"}
+            payload = entry.get("payload") or {}
+            missing = [
+                key for key in self._BATCH_PAYLOAD_KEYS[cmd] if key not in payload
+            ]
+            if missing:
+                return {
+                    "result": f"Error: Missing {', '.join(missing)} in payload of command '{cmd}'"
+                }
+            parsed.append((cmd, payload))
+
+        try:
+            paths = list(dict.fromkeys(payload["path"] for _, payload in parsed))
+            head_oid, blobs = self._get_branch_files(
+                owner, repo_name, working_branch, paths
+            )
+
+            # Apply the commands in order to an in-memory view of the files, None
+            # meaning absent
+            files: Dict[str, Optional[Dict[str, Any]]] = dict(blobs)
+            for cmd, payload in parsed:
+                path = payload["path"]
+                current = files[path]
+                if cmd == Command.EDIT:
+                    if current is None:
+                        return {"result": f"Error: File {path} not found"}
+                    if (
+                        current["isBinary"]
+                        or current["isTruncated"]
+                        or current["text"] is None
+                    ):
+                        return {
+                            "result": f"Error: File {path} cannot be edited as text"
+                        }
+                    # Same uniqueness check as _edit_file; the text was just read
+                    parts = self._split_at_original(
+                        current["text"], payload["original"]
+                    )
+                    if len(parts) == 1:
+                        return {"result": f"Error: Original string not found in {path}"}
+                    if len(parts) != 2:
+                        return {
+                            "result": f"Error: Original string appears multiple times in {path}. Please provide more context"
+                        }
+                    text = parts[0] + payload["replacement"] + parts[1]
+                    files[path] = {
+                        "text": text,
+                        "isBinary": False,
+                        "isTruncated": False,
+                    }
+                elif cmd == Command.CREATE:
+                    if current is not None:
+                        return {"result": f"Error: File {path} already exists"}
+                    files[path] = {
+                        "text": payload["content"],
+                        "isBinary": False,
+                        "isTruncated": False,
+                    }
+                elif cmd == Command.DELETE:
+                    if current is None:
+                        return {"result": f"Error: File {path} not found"}
+                    files[path] = None
+
+            additions = [
+                {
+                    "path": path,
+                    "contents": b64encode(blob["text"].encode("utf-8")).decode("utf-8"),
+                }
+                for path, blob in files.items()
+                if blob is not None and blob is not blobs[path]
+            ]
+            deletions = [
+                {"path": path}
+                for path, blob in files.items()
+                if blob is None and blobs[path] is not None
+            ]
+            if not additions and not deletions:
+                return {"result": "No changes to commit"}
+
+            commit_input = {
+                "branch": {
+                    "repositoryNameWithOwner": repo,
+                    "branchName": working_branch,
+                },
+                "message": {"headline": message},
+                "expectedHeadOid": head_oid,
+                "fileChanges": {"additions": additions, "deletions": deletions},
+            }
+            self._graphql(CREATE_COMMIT_MUTATION, {"input": commit_input})
+            self._invalidate_cache(owner, repo_name, working_branch)
+            return {"result": f"Committed {len(parsed)} changes successfully"}
+
+        except (requests.RequestException, ValueError) as e:
+            if self.raise_on_failure:
+                raise
+            return {"result": f"Error: {str(e)}"}
+
     @component.output_types(result=str)
     def run(
         self,
@@ -280,19 +683,13 @@ class GithubFileEditor:
         working_branch = branch if branch is not None else self.default_branch
         owner, repo_name = repo.split("/")
 
-        command_handlers: Dict[Command, Any] = {
-            Command.EDIT: self._edit_file,
-            Command.UNDO: self._undo_changes,
-            Command.CREATE: self._create_file,
-            Command.DELETE: self._delete_file,
-        }
-
-        if command not in command_handlers:
+        # Convert string command to Command enum if needed
+        try:
+            cmd = Command(command)
+        except ValueError:
             return {"result": f"Error: Unknown command '{command}'"}
 
-        # Convert string command to Command enum if needed
-        cmd = Command(command) if isinstance(command, str) else command
-        handler = command_handlers[cmd]
+        handler = getattr(self, self._COMMAND_HANDLERS[cmd])
         result = handler(owner, repo_name, payload, working_branch)
         return {"result": result}
 
@@ -1,13 +1,41 @@
 import re
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 import requests
 from haystack import Document, component, default_from_dict, default_to_dict, logging
 from haystack.utils import deserialize_secrets_inplace
 from haystack.utils.auth import Secret
 
+from dc_custom_component.components.github.etag_cache import ETagCache
+from dc_custom_component.components.github.retry import get_session
+
 logger = logging.getLogger(__name__)
 
+ISSUE_URL_PATTERN = re.compile(r"https?://github\.com/([^/]+)/([^/]+)/issues/(\d+)")
+
+REPOS_URL = "https://api.github.com/repos"
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Maximum number of issues fetched at the same time by run_many without GraphQL; each
+# also fetches its comments concurrently
+MAX_CONCURRENT_ISSUES = 5
+
+# Maximum number of issues requested in one GraphQL query by run_many
+GRAPHQL_MAX_ISSUES = 50
+
+# Issue fields read in a GraphQL query; 30 comments are as many as the REST endpoint
+# returns by default
+GRAPHQL_ISSUE_FIELDS = (
+    "title body number state createdAt updatedAt url author { login } "
+    "comments(first: 30) { nodes { body createdAt updatedAt url author { login } } }"
+)
+
+# Author of content whose account was deleted, as the REST API reports it
+GHOST_USER = {"login": "ghost"}
+
 
 @component
 class GithubIssueViewer:
@@ -54,17 +82,14 @@ class GithubIssueViewer:
             "Accept": "application/vnd.github.v3+json",
             "User-CustomAgent": "Haystack/GithubIssueViewer",
         }
-
-    def _get_request_headers(self) -> dict:
-        """
-        Get headers with resolved token for the request.
-
-        :return: Dictionary of headers including authorization if token is present
-        """
-        headers = self.headers.copy()
+        self._request_headers = self.headers.copy()
         if self.github_token:
-            headers["Authorization"] = f"Bearer {self.github_token.resolve_value()}"
-        return headers
+            self._request_headers["Authorization"] = (
+                f"Bearer {self.github_token.resolve_value()}"
+            )
+        self._session = get_session(retry_attempts)
+        # An issue revisited unchanged is answered by a bodiless 304
+        self._etag_cache = ETagCache()
 
     def _parse_github_url(self, url: str) -> tuple[str, str, int]:
         """
@@ -74,8 +99,7 @@ class GithubIssueViewer:
         :return: Tuple of (owner, repo, issue_number)
         :raises ValueError: If URL format is invalid
         """
-        pattern = r"https?://github\.com/([^/]+)/([^/]+)/issues/(\d+)"
-        match = re.match(pattern, url)
+        match = ISSUE_URL_PATTERN.match(url)
         if not match:
             raise ValueError(f"Invalid GitHub issue URL format: {url}")
 
@@ -91,10 +115,7 @@ class GithubIssueViewer:
         :param issue_number: Issue number
         :return: Issue data dictionary
         """
-        url = f"https://api.github.com/repos/{owner}/{repo}/issues/{issue_number}"
-        response = requests.get(url, headers=self._get_request_headers())
-        response.raise_for_status()
-        return response.json()
+        return self._get_json(f"{REPOS_URL}/{owner}/{repo}/issues/{issue_number}")
 
     def _fetch_comments(self, comments_url: str) -> Any:
         """
@@ -103,9 +124,108 @@ class GithubIssueViewer:
         :param comments_url: URL for issue comments
         :return: List of comment dictionaries
         """
-        response = requests.get(comments_url, headers=self._get_request_headers())
+        return self._get_json(comments_url)
+
+    def _get_json(self, url: str) -> Any:
+        """
+        Get a JSON resource from the GitHub API, revalidating a cached response with its ETag.
+
+        :param url: API URL
+        :return: Parsed response
+        """
+        headers = self._request_headers
+        cached = self._etag_cache.get(url)
+        if cached is not None:
+            headers = {**headers, "If-None-Match": cached[0]}
+
+        response = self._session.get(url, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            self._etag_cache.put(url, *cached)
+            return cached[1]
         response.raise_for_status()
-        return response.json()
+        data = orjson.loads(response.content)
+
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache.put(url, etag, data)
+        return data
+
+    def _fetch_issues_graphql(
+        self, issues: List[Tuple[str, str, int]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch several issues and their comments with a single GraphQL query.
+
+        :param issues: Tuples of (owner, repo, issue_number)
+        :return: Issue data per entry of `issues`, None if GitHub returned no issue for it
+        """
+        repositories: Dict[Tuple[str, str], List[int]] = {}
+        for owner, repo, issue_number in issues:
+            repositories.setdefault((owner, repo), []).append(issue_number)
+
+        declarations: List[str] = []
+        selections: List[str] = []
+        variables: Dict[str, str] = {}
+        aliases: Dict[Tuple[str, str], str] = {}
+        for r, ((owner, repo), issue_numbers) in enumerate(repositories.items()):
+            declarations.extend([f"$o{r}: String!", f"$n{r}: String!"])
+            variables.update({f"o{r}": owner, f"n{r}": repo})
+            aliases[(owner, repo)] = f"r{r}"
+            issue_selections = " ".join(
+                f"i{number}: issue(number: {number}) {{ {GRAPHQL_ISSUE_FIELDS} }}"
+                for number in dict.fromkeys(issue_numbers)
+            )
+            selections.append(
+                f"r{r}: repository(owner: $o{r}, name: $n{r}) {{ {issue_selections} }}"
+            )
+
+        query = f"query({', '.join(declarations)}) {{ {' '.join(selections)} }}"
+        response = self._session.post(
+            GRAPHQL_URL,
+            headers=self._request_headers,
+            json={"query": query, "variables": variables},
+        )
+        response.raise_for_status()
+        # Issues that cannot be resolved come back as null next to an error, so errors
+        # are not raised here
+        data = orjson.loads(response.content).get("data") or {}
+
+        return [
+            (data.get(aliases[(owner, repo)]) or {}).get(f"i{issue_number}")
+            for owner, repo, issue_number in issues
+        ]
+
+    def _create_graphql_documents(self, issue: Dict[str, Any]) -> List[Document]:
+        """
+        Create the issue and comment Documents from GraphQL issue data, with the same content and meta as run().
+
+        :param issue: Issue data from a GraphQL query with GRAPHQL_ISSUE_FIELDS
+        :return: Issue document followed by its comment documents
+        """
+
+        def to_rest(node: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                "body": node["body"],
+                "created_at": node["createdAt"],
+                "updated_at": node["updatedAt"],
+                "user": node["author"] or GHOST_USER,
+                "html_url": node["url"],
+            }
+
+        issue_data = {
+            **to_rest(issue),
+            # REST returns no body rather than an empty one
+            "body": issue["body"] or None,
+            "title": issue["title"],
+            "number": issue["number"],
+            "state": issue["state"].lower(),
+        }
+        documents = [self._create_issue_document(issue_data)]
+        documents.extend(
+            self._create_comment_document(to_rest(comment), issue["number"])
+            for comment in issue["comments"]["nodes"]
+        )
+        return documents
 
     def _create_issue_document(self, issue_data: dict) -> Document:
         """
@@ -186,17 +306,19 @@ class GithubIssueViewer:
         try:
             owner, repo, issue_number = self._parse_github_url(url)
 
-            # Fetch issue data
-            issue_data = self._fetch_issue(owner, repo, issue_number)
-            documents = [self._create_issue_document(issue_data)]
+            # The comments URL is known up front, so comments are fetched while the
+            # issue is fetched
+            comments_url = f"{REPOS_URL}/{owner}/{repo}/issues/{issue_number}/comments"
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                comments_future = executor.submit(self._fetch_comments, comments_url)
+                issue_data = self._fetch_issue(owner, repo, issue_number)
+                comments = comments_future.result()
 
-            # Fetch and process comments if they exist
-            if issue_data["comments"] > 0:
-                comments = self._fetch_comments(issue_data["comments_url"])
-                documents.extend(
-                    self._create_comment_document(comment, issue_number)
-                    for comment in comments
-                )
+            documents = [self._create_issue_document(issue_data)]
+            documents.extend(
+                self._create_comment_document(comment, issue_number)
+                for comment in comments
+            )
 
             return {"documents": documents}
 
@@ -215,3 +337,52 @@ class GithubIssueViewer:
                 },
             )
             return {"documents": [error_doc]}
+
+    def run_many(self, urls: List[str]) -> Dict[str, List[Document]]:
+        """
+        Process several GitHub issue URLs, e.g. to expand linked issues.
+
+        With a token, the issues and their comments are read with one GraphQL query per GRAPHQL_MAX_ISSUES issues.
+        Invalid URLs, issues the query does not return (such as pull requests), and all issues if there is no token or
+        the query fails are processed concurrently by run(), including its error handling.
+
+        :param urls: GitHub issue URLs
+        :return: Dictionary containing the documents of all issues, in the order of `urls`
+        """
+        results: List[Optional[List[Document]]] = [None] * len(urls)
+
+        if self.github_token:
+            parsed: Dict[int, Tuple[str, str, int]] = {}
+            for i, url in enumerate(urls):
+                try:
+                    parsed[i] = self._parse_github_url(url)
+                except ValueError:
+                    continue
+
+            indices = list(parsed)
+            for start in range(0, len(indices), GRAPHQL_MAX_ISSUES):
+                batch = indices[start : start + GRAPHQL_MAX_ISSUES]
+                try:
+                    issues = self._fetch_issues_graphql([parsed[i] for i in batch])
+                except requests.RequestException as e:
+                    logger.warning(
+                        f"Batched issue query failed, fetching the issues one by one: {str(e)}"
+                    )
+                    continue
+                for i, issue in zip(batch, issues):
+                    if issue is not None:
+                        results[i] = self._create_graphql_documents(issue)
+
+        remaining = [i for i, documents in enumerate(results) if documents is None]
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_ISSUES) as executor:
+            fetched = executor.map(
+                lambda i: self.run(url=urls[i])["documents"], remaining
+            )
+            for i, documents in zip(remaining, fetched):
+                results[i] = documents
+
+        return {
+            "documents": [
+                doc for documents in results if documents for doc in documents
+            ]
+        }
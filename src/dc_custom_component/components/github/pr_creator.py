@@ -1,12 +1,23 @@
 from typing import Any, Dict, Optional
 
+import orjson
 import requests
 from haystack import component, default_from_dict, default_to_dict, logging
 from haystack.utils import deserialize_secrets_inplace
 from haystack.utils.auth import Secret
 
+from dc_custom_component.components.github.retry import get_session
+
 logger = logging.getLogger(__name__)
 
+REPOS_URL = "https://api.github.com/repos"
+
+
+def _was_retried(response: requests.Response) -> bool:
+    """Check whether the adapter sent the request more than once before this response."""
+    retries = getattr(response.raw, "retries", None)
+    return bool(getattr(retries, "history", None))
+
 
 @component
 class GitHubPRCreator:
@@ -69,24 +80,54 @@ class GitHubPRCreator:
         self.maintainer_can_modify = maintainer_can_modify
         self.retry_attempts = retry_attempts
 
+        # Transient failures are retried by the session's adapter with jittered backoff,
+        # honoring Retry-After. A replayed POST cannot open a second PR; GitHub rejects it
+        # with 422, and _create_pull_request then returns the PR the first attempt opened.
+        self._session = get_session(retry_attempts, allowed_methods=["POST"])
+
         # Set up the headers for GitHub API requests
         self.base_headers = {
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "Haystack/GitHubPRCreator",
         }
+        self._request_headers = {
+            **self.base_headers,
+            "Authorization": f"Bearer {self.github_token.resolve_value()}",
+        }
 
-    def _get_request_headers(self) -> dict:
+    def _find_open_pull_request(
+        self, url: str, owner: str, head_branch: str, base_branch: str
+    ) -> Optional[Dict[str, Any]]:
         """
-        Get headers with resolved token for the request.
+        Get the open pull request from a head branch into a base branch.
 
-        :return: Dictionary of headers including authorization
+        :param url: Pulls endpoint of the repository
+        :param owner: Owner of the head branch
+        :param head_branch: Branch containing the changes
+        :param base_branch: Branch to merge changes into
+        :return: API response data of the pull request, or None if there is none
         """
-        headers = self.base_headers.copy()
-        headers["Authorization"] = f"Bearer {self.github_token.resolve_value()}"
-        return headers
+        response = self._session.get(
+            url,
+            headers=self._request_headers,
+            params={
+                "head": f"{owner}:{head_branch}",
+                "base": base_branch,
+                "state": "open",
+            },
+        )
+        response.raise_for_status()
+        pulls = orjson.loads(response.content)
+        return pulls[0] if pulls else None  # type: ignore
 
     def _create_pull_request(
-        self, head_branch: str, base_branch: str, title: str, body: str, repo: str
+        self,
+        head_branch: str,
+        base_branch: str,
+        title: str,
+        body: str,
+        url: str,
+        owner: str,
     ) -> Dict[str, Any]:
         """
         Create a pull request via the GitHub API.
@@ -95,13 +136,10 @@ class GitHubPRCreator:
         :param base_branch: Branch to merge changes into
         :param title: Pull request title
         :param body: Pull request description
-        :param repo: owner/repo
+        :param url: Pulls endpoint of the repository
+        :param owner: Owner of the repository, which holds the head branch
         :return: API response data
         """
-        owner, repository = repo.split("/")
-
-        url = f"https://api.github.com/repos/{owner}/{repository}/pulls"
-
         data = {
             "head": head_branch,
             "base": base_branch,
@@ -111,9 +149,19 @@ class GitHubPRCreator:
             "maintainer_can_modify": self.maintainer_can_modify,
         }
 
-        response = requests.post(url, headers=self._get_request_headers(), json=data)
+        response = self._session.post(url, headers=self._request_headers, json=data)
+        if response.status_code == 422 and _was_retried(response):
+            # The first attempt may have opened the PR before its response was lost
+            existing = self._find_open_pull_request(
+                url, owner, head_branch, base_branch
+            )
+            if existing is not None:
+                logger.warning(
+                    f"Pull request from '{head_branch}' was created despite an incomplete response"
+                )
+                return existing
         response.raise_for_status()
-        return response.json()  # type: ignore
+        return orjson.loads(response.content)  # type: ignore
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -175,10 +223,13 @@ class GitHubPRCreator:
         # At this point, repo_to_use is guaranteed to be a string
         repo_to_use = str(repo_to_use)
 
-        if len(repo_to_use.split("/")) != 2:
+        parts = repo_to_use.split("/")
+        if len(parts) != 2 or not all(parts):
             raise ValueError(
                 "Invalid format for `repo`. The format has to correspond to owner/repo."
             )
+        owner, repository = parts
+        pulls_url = f"{REPOS_URL}/{owner}/{repository}/pulls"
 
         # If issue_url is provided, add a link to the issue in the PR body
         pr_body = body
@@ -186,36 +237,22 @@ class GitHubPRCreator:
             issue_link = f"\n\nCloses {issue_url}"
             pr_body = body + issue_link
 
-        attempts = 0
-        last_error = None
-
-        target_base = self.base_branch
-
-        while attempts <= self.retry_attempts:
-            try:
-                pr_data = self._create_pull_request(
-                    head_branch=head_branch,
-                    base_branch=target_base,
-                    title=title,
-                    body=pr_body,
-                    repo=repo_to_use,
-                )
-
-                return {
-                    "pr_url": pr_data["html_url"],
-                    "pr_number": pr_data["number"],
-                    "pr_data": pr_data,
-                }
-
-            except Exception as e:
-                attempts += 1
-                last_error = e
-                if attempts <= self.retry_attempts:
-                    logger.warning(f"Attempt {attempts} failed: {str(e)}. Retrying...")
-                else:
-                    break
-
-        # If we get here, all attempts failed
-        error_message = f"Failed to create PR after {self.retry_attempts + 1} attempts. Last error: {str(last_error)}"
-        logger.error(error_message)
-        raise RuntimeError(error_message)
+        try:
+            pr_data = self._create_pull_request(
+                head_branch=head_branch,
+                base_branch=self.base_branch,
+                title=title,
+                body=pr_body,
+                url=pulls_url,
+                owner=owner,
+            )
+        except requests.RequestException as e:
+            error_message = f"Failed to create PR: {str(e)}"
+            logger.error(error_message)
+            raise RuntimeError(error_message) from e
+
+        return {
+            "pr_url": pr_data["html_url"],
+            "pr_number": pr_data["number"],
+            "pr_data": pr_data,
+        }
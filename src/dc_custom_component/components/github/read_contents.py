@@ -1,6 +1,7 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from haystack import (
+    Document,
     SuperComponent,
     component,
     Pipeline,
@@ -8,15 +9,48 @@ from haystack import (
     default_to_dict,
 )
 from haystack.utils import Secret, deserialize_secrets_inplace
-from haystack.components.builders import PromptBuilder
 
 from dc_custom_component.components.github.repo_viewer import GithubRepositoryViewer
 
+# Prefix of each item in a directory listing, by item type
+ITEM_ICONS = {"dir": "📁 "}
+DEFAULT_ITEM_ICON = "📄 "
+
+
+@component
+class _ContentFormatter:
+    """
+    Formats the documents of GithubRepositoryViewer as text for the agent.
+
+    A single file is shown with its content, a directory as a listing of its items.
+    """
+
+    @component.output_types(prompt=str)
+    def run(self, path: str, documents: List[Document]) -> Dict[str, str]:
+        """
+        Format repository content.
+
+        :param path: Requested path in the repository
+        :param documents: Documents returned by GithubRepositoryViewer
+        :return: Dictionary containing the formatted content
+        """
+        if documents and documents[0].meta.get("type") == "file_content":
+            return {
+                "prompt": f"File content for {path}:\n```\n{documents[0].content}\n```\n"
+            }
+
+        lines = [f"Directory listing for {path}:"]
+        lines.extend(
+            f"{ITEM_ICONS.get(doc.meta.get('type', ''), DEFAULT_ITEM_ICON)}{doc.meta.get('path')}"
+            for doc in documents
+        )
+        return {"prompt": "\n".join(lines) + "\n"}
+
 
 @component
 class GithubContentViewer(SuperComponent):
     """
-    A SuperComponent that combines GithubRepositoryViewer and PromptBuilder to fetch
+    A SuperComponent that combines GithubRepositoryViewer and a formatter to fetch
     and format GitHub repository content.
 
     For directories:
@@ -54,6 +88,7 @@ class GithubContentViewer(SuperComponent):
         raise_on_failure: bool = True,
         max_file_size: int = 1_000_000,  # 1MB default limit
         branch: Optional[str] = None,
+        cache_path: Optional[str] = None,
     ):
         """
         Initialize the GitHubContentViewer.
@@ -63,12 +98,14 @@ class GithubContentViewer(SuperComponent):
         :param raise_on_failure: If True, raises exceptions on API errors
         :param max_file_size: Maximum file size in bytes to fetch (default: 1MB)
         :param branch: Default branch to use
+        :param cache_path: Path of an SQLite file that persists fetched content across restarts, revalidated with ETags
         """
         self.repo = repo
         self.github_token = github_token
         self.raise_on_failure = raise_on_failure
         self.max_file_size = max_file_size
         self.branch = branch
+        self.cache_path = cache_path
 
         # Create the repository viewer component
         repo_viewer = GithubRepositoryViewer(
@@ -77,56 +114,29 @@ class GithubContentViewer(SuperComponent):
             max_file_size=max_file_size,
             repo=repo,
             branch=branch,
+            cache_path=cache_path,
         )
 
-        # Create template for directory listings
-        dir_template = """
-Directory listing for {{path}}:
-{% for doc in documents %}{% if doc.meta.type == 'dir' %}📁 {% else %}📄 {% endif %}{{ doc.meta.path }}
-{% endfor %}
-"""
-
-        # Create template for file content
-        file_template = """
-File content for {{path}}:
-```
-{{ documents[0].content }}
-```
-"""
-
-        # Create the prompt builder with conditional template
-        prompt_builder = PromptBuilder(
-            template="""
-{% if documents[0].meta.type == 'file_content' %}
-"""
-            + file_template
-            + """
-{% else %}
-"""
-            + dir_template
-            + """
-{% endif %}
-"""
-        )
+        formatter = _ContentFormatter()
 
         # Create the internal pipeline
         pp = Pipeline()
         pp.add_component("repo_viewer", repo_viewer)
-        pp.add_component("prompt_builder", prompt_builder)
+        pp.add_component("formatter", formatter)
 
         # Connect components
-        pp.connect("repo_viewer.documents", "prompt_builder.documents")
+        pp.connect("repo_viewer.documents", "formatter.documents")
 
         # Initialize the parent SuperComponent with the pipeline
         super(GithubContentViewer, self).__init__(
             pipeline=pp,
             input_mapping={
-                "path": ["repo_viewer.path", "prompt_builder.path"],
+                "path": ["repo_viewer.path", "formatter.path"],
                 "branch": ["repo_viewer.branch"],
                 "repo": ["repo_viewer.repo"],
             },
             output_mapping={
-                "prompt_builder.prompt": "result",
+                "formatter.prompt": "result",
             },
         )
 
@@ -143,6 +153,7 @@ File content for {{path}}:
             raise_on_failure=self.raise_on_failure,
             max_file_size=self.max_file_size,
             branch=self.branch,
+            cache_path=self.cache_path,
         )
 
     @classmethod
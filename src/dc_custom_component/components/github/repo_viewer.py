@@ -1,13 +1,22 @@
 import base64
+import sqlite3
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import requests
+import orjson
 from haystack import Document, component, logging, default_to_dict, default_from_dict
 from haystack.utils import Secret, deserialize_secrets_inplace
 
+from dc_custom_component.components.github.etag_cache import ETagCache
+from dc_custom_component.components.github.retry import get_session
+
 logger = logging.getLogger(__name__)
 
+# Total size of the response bodies kept in the on-disk cache; least recently used
+# entries are evicted first
+DISK_CACHE_MAX_BYTES = 100_000_000
+
 
 @dataclass
 class GitHubItem:
@@ -76,6 +85,8 @@ class GithubRepositoryViewer:
         max_file_size: int = 1_000_000,  # 1MB default limit
         repo: Optional[str] = None,
         branch: Optional[str] = None,
+        cache_path: Optional[str] = None,
+        retry_attempts: int = 2,
     ):
         """
         Initialize the component.
@@ -83,6 +94,8 @@ class GithubRepositoryViewer:
         :param github_token: GitHub personal access token for API authentication
         :param raise_on_failure: If True, raises exceptions on API errors
         :param max_file_size: Maximum file size in bytes to fetch (default: 1MB)
+        :param cache_path: Path of an SQLite file that persists ETags and responses across restarts
+        :param retry_attempts: Number of retry attempts for connection errors, 429 and 5xx responses
         """
         if github_token is not None and not isinstance(github_token, Secret):
             raise TypeError("github_token must be a Secret")
@@ -92,11 +105,23 @@ class GithubRepositoryViewer:
         self.max_file_size = max_file_size
         self.repo = repo
         self.branch = branch
+        self.cache_path = cache_path
+        self.retry_attempts = retry_attempts
 
         self.headers = {
             "Accept": "application/vnd.github.v3+json",
             "User-CustomAgent": "Haystack/GithubRepositoryViewer",
         }
+        self._request_headers = self.headers.copy()
+        if self.github_token:
+            self._request_headers["Authorization"] = (
+                f"Bearer {self.github_token.resolve_value()}"
+            )
+        self._session = get_session(retry_attempts)
+        # Unchanged content is answered by a bodiless 304
+        self._etag_cache = ETagCache()
+        # Opened on first use, so deserializing the component does not touch the disk
+        self._disk_cache: Optional[sqlite3.Connection] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -109,6 +134,8 @@ class GithubRepositoryViewer:
             github_token=self.github_token.to_dict() if self.github_token else None,
             raise_on_failure=self.raise_on_failure,
             max_file_size=self.max_file_size,
+            cache_path=self.cache_path,
+            retry_attempts=self.retry_attempts,
         )
 
     @classmethod
@@ -123,6 +150,23 @@ class GithubRepositoryViewer:
         deserialize_secrets_inplace(init_params, keys=["github_token"])
         return default_from_dict(cls, data)  # type: ignore
 
+    def close(self) -> None:
+        """
+        Close the on-disk cache if it was opened.
+
+        It is opened again on the next request, so the viewer stays usable. The pooled session is shared by all
+        viewers, so it is left open for the others.
+        """
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
+
+    def __enter__(self) -> "GithubRepositoryViewer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def _parse_repo(self, repo: str) -> tuple[str, str]:
         """Parse owner/repo string"""
         parts = repo.split("/")
@@ -136,6 +180,40 @@ class GithubRepositoryViewer:
         """Normalize repository path"""
         return path.strip("/")
 
+    def _get_disk_cache(self) -> sqlite3.Connection:
+        """Open the on-disk ETag cache, creating its table on first use"""
+        if self._disk_cache is None:
+            self._disk_cache = sqlite3.connect(self.cache_path, check_same_thread=False)  # type: ignore[arg-type]
+            self._disk_cache.execute(
+                "CREATE TABLE IF NOT EXISTS etags "
+                "(url TEXT PRIMARY KEY, etag TEXT NOT NULL, body BLOB NOT NULL, used REAL NOT NULL)"
+            )
+        return self._disk_cache
+
+    def _load_from_disk(self, url: str) -> Optional[Tuple[str, Any]]:
+        """Get the ETag and parsed response stored on disk for a URL"""
+        row = (
+            self._get_disk_cache()
+            .execute("SELECT etag, body FROM etags WHERE url = ?", (url,))
+            .fetchone()
+        )
+        if row is None:
+            return None
+        return row[0], orjson.loads(row[1])
+
+    def _store_on_disk(self, url: str, etag: str, body: bytes) -> None:
+        """Store the raw response for a URL and evict the least recently used entries beyond the size limit"""
+        with self._get_disk_cache() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO etags VALUES (?, ?, ?, ?)",
+                (url, etag, body, time.time()),
+            )
+            db.execute(
+                "DELETE FROM etags WHERE url IN (SELECT url FROM "
+                "(SELECT url, SUM(LENGTH(body)) OVER (ORDER BY used DESC) AS total FROM etags) WHERE total > ?)",
+                (DISK_CACHE_MAX_BYTES,),
+            )
+
     def _fetch_contents(
         self, owner: str, repo: str, path: str, ref: Optional[str] = None
     ) -> Any:
@@ -144,13 +222,33 @@ class GithubRepositoryViewer:
         if ref:
             url += f"?ref={ref}"
 
-        headers = self.headers.copy()
-        if self.github_token:
-            headers["Authorization"] = f"Bearer {self.github_token.resolve_value()}"
-
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        headers = self._request_headers
+        cached = self._etag_cache.get(url)
+        if cached is None and self.cache_path:
+            cached = self._load_from_disk(url)
+        if cached is not None:
+            headers = {**headers, "If-None-Match": cached[0]}
+
+        response = self._session.get(url, headers=headers)
+        etag: Optional[str]
+        if response.status_code == 304 and cached is not None:
+            if self.cache_path:
+                with self._get_disk_cache() as db:
+                    db.execute(
+                        "UPDATE etags SET used = ? WHERE url = ?", (time.time(), url)
+                    )
+            contents = cached[1]
+            etag = cached[0]
+        else:
+            response.raise_for_status()
+            contents = orjson.loads(response.content)
+            etag = response.headers.get("ETag")
+            if etag and self.cache_path:
+                self._store_on_disk(url, etag, response.content)
+
+        if etag:
+            self._etag_cache.put(url, etag, contents)
+        return contents
 
     def _process_file_content(self, content: str, encoding: str) -> str:
         """Process file content based on encoding"""
@@ -0,0 +1,113 @@
+import random
+import time
+from typing import Any, Collection, Dict, FrozenSet, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import BaseHTTPResponse
+from urllib3.util import Retry
+
+
+class GithubRetry(Retry):
+    """
+    urllib3 retry policy tuned for the GitHub API.
+
+    Differences to the default `Retry`:
+    - Backoff uses full jitter: a random delay between 0 and `min(backoff_max, backoff_factor * 2 ** n)`,
+      so clients that failed together do not retry together.
+    - `Retry-After` is also honored on 403, which GitHub uses for secondary rate limits.
+    - A 429 for an exhausted primary rate limit waits until `X-RateLimit-Reset`, at most `RATE_LIMIT_WAIT_MAX` seconds.
+
+    ### Usage example
+    ```python
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=GithubRetry(total=3)))
+    ```
+    """
+
+    RETRY_AFTER_STATUS_CODES = frozenset({403, 413, 429, 503})
+
+    # Longest wait for a primary rate limit reset; it can be up to an hour away
+    RATE_LIMIT_WAIT_MAX = 60.0
+
+    def __init__(self, total: int = 3, **kwargs: Any) -> None:
+        """
+        Create the retry policy.
+
+        Unrecoverable 4xx responses are not retried. 429 and 5xx responses and connection errors are retried
+        with exponential backoff of base `backoff_factor` (1s) capped at `backoff_max` (30s).
+
+        :param total: Maximum number of retries
+        :param kwargs: Further arguments passed on to `urllib3.util.Retry`
+        """
+        kwargs.setdefault("backoff_factor", 1.0)
+        kwargs.setdefault("backoff_max", 30)
+        kwargs.setdefault("status_forcelist", [429, 500, 502, 503, 504])
+        kwargs.setdefault("respect_retry_after_header", True)
+        kwargs.setdefault("raise_on_status", False)
+        super().__init__(total=total, **kwargs)
+
+    def get_backoff_time(self) -> float:
+        """
+        Get the delay before the next attempt using exponential backoff with full jitter.
+
+        :return: Delay in seconds, 0 before the first retry
+        """
+        attempts = len(self.history)
+        if attempts == 0:
+            return 0.0
+        cap: float = min(self.backoff_max, self.backoff_factor * (2 ** (attempts - 1)))
+        return random.random() * cap
+
+    def get_retry_after(self, response: BaseHTTPResponse) -> Optional[float]:
+        """
+        Get the delay requested by the response.
+
+        Without a `Retry-After` header, an exhausted primary rate limit is waited out until its reset time.
+
+        :param response: The response to retry
+        :return: Delay in seconds, or None to use the backoff
+        """
+        retry_after = super().get_retry_after(response)
+        if (
+            retry_after is not None
+            or response.headers.get("X-RateLimit-Remaining") != "0"
+        ):
+            return retry_after
+        reset = response.headers.get("X-RateLimit-Reset", "")
+        if not reset.isdigit():
+            return None
+        return min(max(0.0, int(reset) - time.time()), self.RATE_LIMIT_WAIT_MAX)
+
+
+# Sessions shared by all components with the same retry policy, so repeated runs and
+# several components reuse keep-alive connections to api.github.com. The token is sent
+# per request, since components may authenticate differently.
+_SESSIONS: Dict[Tuple[int, FrozenSet[str]], requests.Session] = {}
+
+
+def get_session(
+    retry_attempts: int,
+    allowed_methods: Collection[str] = Retry.DEFAULT_ALLOWED_METHODS,
+) -> requests.Session:
+    """
+    Get the shared session for a retry policy, creating it on first use.
+
+    :param retry_attempts: Number of retry attempts for connection errors, 429 and 5xx responses
+    :param allowed_methods: HTTP methods that are retried; only include methods that are safe to replay
+    :return: Session with pooled connections and the retry policy mounted
+    """
+    key = (retry_attempts, frozenset(allowed_methods))
+    session = _SESSIONS.get(key)
+    if session is None:
+        retry = GithubRetry(total=retry_attempts, allowed_methods=key[1])
+        session = requests.Session()
+        session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry),
+        )
+        _SESSIONS[key] = session
+    return session
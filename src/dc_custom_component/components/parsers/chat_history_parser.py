@@ -3,6 +3,9 @@ from haystack.dataclasses import ChatMessage
 from typing import List, Dict
 import re
 import ast
+import json
+
+CURRENT_QUESTION_PATTERN = re.compile(r"Current Question: (.*?)$", re.DOTALL)
 
 
 @component
@@ -68,28 +71,19 @@ class DeepsetChatHistoryParser:
             if array_start == -1:
                 return {"messages": [ChatMessage.from_user(history_and_query)]}
 
-            # Now find where this array ends by parsing it as JSON
-            # Try progressively longer substrings until we find valid JSON
-            for i in range(array_start + 1, len(history_and_query)):
-                try:
-                    candidate = history_and_query[array_start:i]
-                    if candidate.count("[") > 0 and candidate[-1] == "]":
-                        # Only try to parse if we have at least one opening and closing bracket
-                        ast.literal_eval(candidate)
-                        # If we get here, we found valid JSON. But we need to make sure
-                        # we got the full outer array, not just a nested valid JSON object
-                        if candidate.strip()[-1] == "]":
-                            history_json = candidate
-                            break
-                except (SyntaxError, ValueError):
-                    continue
-            else:
-                # No valid JSON found
+            # Find where this array ends with a single pass over the brackets
+            array_end = self._find_array_end(history_and_query, array_start)
+            if array_end == -1:
                 return {"messages": [ChatMessage.from_user(history_and_query)]}
 
+            history_json = history_and_query[array_start:array_end]
             messages = []
             try:
-                chat_history = ast.literal_eval(history_json)
+                try:
+                    chat_history = json.loads(history_json)
+                except json.JSONDecodeError:
+                    # Still accept Python literals, e.g. single-quoted histories
+                    chat_history = ast.literal_eval(history_json)
                 # Convert each message to ChatMessage
                 for msg in chat_history:
                     if msg["role"] == "user":
@@ -100,9 +94,7 @@ class DeepsetChatHistoryParser:
                 return {"messages": [ChatMessage.from_user(history_and_query)]}
 
             # Extract current query - everything after "Current question: "
-            query_match = re.search(
-                r"Current Question: (.*?)$", history_and_query, re.DOTALL
-            )
+            query_match = CURRENT_QUESTION_PATTERN.search(history_and_query)
             if query_match:
                 current_query = query_match.group(1).strip()
                 messages.append(ChatMessage.from_user(current_query))
@@ -115,3 +107,34 @@ class DeepsetChatHistoryParser:
 
         # Default case: return the entire string as a single user message
         return {"messages": [ChatMessage.from_user(history_and_query)]}
+
+    @staticmethod
+    def _find_array_end(text: str, start: int) -> int:
+        """
+        Find the end of the array that opens at `start`, skipping brackets inside string literals.
+
+        :param text: The text containing the array.
+        :param start: Index of the opening bracket.
+        :returns: Index after the matching closing bracket, or -1 if the array is not closed.
+        """
+        depth = 0
+        quote = None
+        escaped = False
+        for i in range(start, len(text)):
+            char = text[i]
+            if quote is not None:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == quote:
+                    quote = None
+            elif char == '"' or char == "'":
+                quote = char
+            elif char == "[":
+                depth += 1
+            elif char == "]":
+                depth -= 1
+                if depth == 0:
+                    return i + 1
+        return -1
@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List
 import json
 import re
 import logging
@@ -7,6 +7,12 @@ from haystack import component
 
 logger = logging.getLogger(__name__)
 
+CODE_BLOCK_PATTERN = re.compile(r"```(?:json)?\n(.*?)\n```", re.DOTALL)
+
+# Characters that change the state of the brace scan; everything in between is skipped
+# in C
+BRACE_SCAN_PATTERN = re.compile(r'[{}"\\]')
+
 
 @component
 class JsonParser:
@@ -43,13 +49,19 @@ class JsonParser:
             Dictionary with 'parsed_json' key containing the parsed JSON object
             or empty dict if no valid JSON found
         """
-        # Try to find JSON within markdown code blocks
-        logger.warning(f"Type is: {type(text)}.")
         if isinstance(text, dict):
             return {"parsed_json": text}
 
-        code_block_pattern = r"```(?:json)?\n(.*?)\n```"
-        code_block_match = re.search(code_block_pattern, text, re.DOTALL)
+        # Fast path for text that is a JSON object as a whole
+        try:
+            parsed = json.loads(text)
+            if isinstance(parsed, dict):
+                return {"parsed_json": parsed}
+        except json.JSONDecodeError:
+            pass
+
+        # Try to find JSON within markdown code blocks
+        code_block_match = CODE_BLOCK_PATTERN.search(text)
 
         if code_block_match:
             try:
@@ -57,10 +69,8 @@ class JsonParser:
             except json.JSONDecodeError:
                 pass
 
-        # Try to find JSON between curly braces
-        json_candidates = self.find_matching_braces(text)
-
-        for candidate in json_candidates:
+        # Try to find JSON between curly braces, stopping at the first group that parses
+        for candidate in self._iter_matching_braces(text):
             try:
                 return {"parsed_json": json.loads(candidate)}
             except json.JSONDecodeError:
@@ -78,27 +88,59 @@ class JsonParser:
         """
         Finds all matching pairs of curly braces in the input text, handling nested structures.
 
+        Braces inside double-quoted strings, e.g. in `{"template": "{name}"}`, are not counted.
+        If a group never closes, e.g. because of a stray quote, the text after its opening brace is searched again.
+
         :param text: The input text to search for matching brace pairs.
         :return: A list of strings, each containing a complete matched brace structure.
 
         Example:
             >>> text = "outer{inner{nested}}other{simple}"
             >>> JsonParser.find_matching_braces(text)
-            ['outer{inner{nested}}', 'other{simple}']
+            ['{inner{nested}}', '{simple}']
+        """
+        return list(JsonParser._iter_matching_braces(text))
+
+    @staticmethod
+    def _iter_matching_braces(text: str) -> Iterator[str]:
+        """
+        Yields the matching brace pairs of `find_matching_braces` one by one, scanning only as far as needed.
+
+        :param text: The input text to search for matching brace pairs.
+        :return: Iterator over the complete matched brace structures.
         """
-        results = []
-        stack: List[str] = []
-        start = -1
-
-        for i, char in enumerate(text):
-            if char == "{":
-                if not stack:
-                    start = i
-                stack.append(char)
-            elif char == "}":
-                if stack:
-                    stack.pop()
-                    if not stack:  # We've found a complete matching pair
-                        results.append(text[start : i + 1])
-
-        return results
+        pos = 0
+        while True:
+            depth = 0
+            start = -1
+            in_string = False
+            escaped_at = -1
+
+            for match in BRACE_SCAN_PATTERN.finditer(text, pos):
+                i = match.start()
+                char = match.group()
+                if in_string:
+                    if i == escaped_at:
+                        continue
+                    if char == "\\":
+                        escaped_at = i + 1
+                    elif char == '"':
+                        in_string = False
+                elif char == '"':
+                    # Quotes only delimit strings inside a brace group
+                    in_string = depth > 0
+                elif char == "{":
+                    if depth == 0:
+                        start = i
+                    depth += 1
+                elif char == "}" and depth > 0:
+                    depth -= 1
+                    if depth == 0:  # We've found a complete matching pair
+                        yield text[start : i + 1]
+
+            if depth == 0:
+                return
+            # The last group never closed, e.g. because a stray quote in malformed output
+            # started a string that swallowed the rest of the text. Scan again from just
+            # after its opening brace.
+            pos = start + 1
@@ -7,6 +7,10 @@ from typing import Dict, List, Union
 
 from haystack import component, logging
 from haystack.dataclasses import ChatMessage
+from haystack.lazy_imports import LazyImport
+
+with LazyImport("Run 'pip install google-re2'") as re2_import:
+    import re2
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +47,7 @@ class RegexParser:
         consider_all_messages: bool = False,
         return_empty_on_no_match: bool = False,
         return_all_matches: bool = False,
+        use_re2: bool = False,
     ):
         """
         Creates an instance of the RegexParser component.
@@ -63,15 +68,33 @@ class RegexParser:
         :param return_all_matches:
             If True, returns a list of all matches in the text as 'captured_texts'.
             If False (default), returns only the first match as 'captured_text'.
+
+        :param use_re2:
+            If True, matches with Google's RE2 engine, which runs in linear time and cannot backtrack
+            catastrophically on user-supplied patterns. RE2 does not support backreferences or lookaround.
+            Requires the `google-re2` package.
         """
         self.regex_pattern = regex_pattern
         self.consider_all_messages = consider_all_messages
         self.return_empty_on_no_match = return_empty_on_no_match
         self.return_all_matches = return_all_matches
+        self.use_re2 = use_re2
+
+        # Compiled once and reused for every message. re2 is untyped; its patterns mirror
+        # the re.Pattern interface used here.
+        self._pattern: "re.Pattern[str]"
+        if use_re2:
+            re2_import.check()
+            self._pattern = re2.compile(regex_pattern)
+        else:
+            self._pattern = re.compile(regex_pattern)
+        # Capture the first group if there is one, otherwise the entire match
+        self._group = 1 if self._pattern.groups > 0 else 0
+        # Output key for the configured match mode
+        self._output_key = "captured_texts" if return_all_matches else "captured_text"
 
         # Check if the pattern has at least one capture group
-        num_groups = re.compile(regex_pattern).groups
-        if num_groups < 1:
+        if self._pattern.groups < 1:
             logger.warning(
                 "The provided regex pattern {regex_pattern} doesn't contain any capture groups. "
                 "The entire match will be returned instead.",
@@ -100,63 +123,13 @@ class RegexParser:
               - If no matches and return_empty_on_no_match=True: {}
         """
         if isinstance(text_or_messages, str):
-            result = self._extract_from_text(text_or_messages)
-
-            if self.return_all_matches:
-                if not result and self.return_empty_on_no_match:
-                    return {}
-                return {"captured_texts": result}
-            else:
-                if not result and self.return_empty_on_no_match:
-                    return {}
-                return {"captured_text": result}
+            return self._build_result(self._extract_from_text(text_or_messages))
 
         if not text_or_messages:
             logger.warning("Received empty list of messages")
-            if self.return_empty_on_no_match:
-                return {}
-            if self.return_all_matches:
-                return {"captured_texts": []}
-            return {"captured_text": ""}
-
-        if self.consider_all_messages:
-            # Try to extract from all messages in the list
-            if self.return_all_matches:
-                all_matches: List[Union[List[str], str]] = []
-                for message in text_or_messages:
-                    if not isinstance(message, ChatMessage):
-                        raise ValueError(
-                            f"Expected ChatMessage object, got {type(message)}"
-                        )
-
-                    if message.text is None:
-                        continue
-
-                    matches = self._extract_from_text(message.text)
-                    all_matches.extend(matches)
-
-                if not all_matches and self.return_empty_on_no_match:
-                    return {}
-                return {"captured_texts": all_matches}
-            else:
-                for message in text_or_messages:
-                    if not isinstance(message, ChatMessage):
-                        raise ValueError(
-                            f"Expected ChatMessage object, got {type(message)}"
-                        )
-
-                    if message.text is None:
-                        continue
-
-                    captured = self._extract_from_text(message.text)
-                    if captured:
-                        return {"captured_text": captured}
-
-                # No match found in any message
-                if self.return_empty_on_no_match:
-                    return {}
-                return {"captured_text": ""}
-        else:
+            return self._build_result([] if self.return_all_matches else "")
+
+        if not self.consider_all_messages:
             # Only consider the last message
             last_message = text_or_messages[-1]
             if not isinstance(last_message, ChatMessage):
@@ -166,22 +139,41 @@ class RegexParser:
 
             if last_message.text is None:
                 logger.warning("Last message has no text content")
-                if self.return_empty_on_no_match:
-                    return {}
-                if self.return_all_matches:
-                    return {"captured_texts": []}
-                return {"captured_text": ""}
-
-            result = self._extract_from_text(last_message.text)
-
-            if self.return_all_matches:
-                if not result and self.return_empty_on_no_match:
-                    return {}
-                return {"captured_texts": result}
-            else:
-                if not result and self.return_empty_on_no_match:
-                    return {}
-                return {"captured_text": result}
+                return self._build_result([] if self.return_all_matches else "")
+
+            return self._build_result(self._extract_from_text(last_message.text))
+
+        # Try to extract from all messages in the list
+        all_matches: List[str] = []
+        for message in text_or_messages:
+            if not isinstance(message, ChatMessage):
+                raise ValueError(f"Expected ChatMessage object, got {type(message)}")
+
+            if message.text is None:
+                continue
+
+            captured = self._extract_from_text(message.text)
+            if not self.return_all_matches:
+                if captured:
+                    return {"captured_text": captured}
+                continue
+            all_matches.extend(captured)
+
+        return self._build_result(all_matches if self.return_all_matches else "")
+
+    def _build_result(self, result: Union[str, List[str]]) -> Dict:
+        """
+        Wrap the extracted text in the output of the configured match mode.
+
+        :param result:
+            The captured text, or the list of captured texts if return_all_matches=True.
+
+        :returns:
+            The output dictionary, or an empty dictionary if nothing matched and return_empty_on_no_match=True.
+        """
+        if not result and self.return_empty_on_no_match:
+            return {}
+        return {self._output_key: result}
 
     def _extract_from_text(self, text: str) -> Union[str, List[str]]:
         """
@@ -200,24 +192,10 @@ class RegexParser:
                 A list of all captured texts (empty list if no matches).
         """
         if not self.return_all_matches:
-            match = re.search(self.regex_pattern, text)
+            match = self._pattern.search(text)
             if not match:
                 return ""
-
-            # If there are capturing groups, return the first one
-            if match.groups():
-                return match.group(1)
-
-            # If no capturing groups, return the entire match
-            return match.group(0)
+            return match.group(self._group)
         else:
-            matches = re.finditer(self.regex_pattern, text)
-            result = []
-
-            for match in matches:
-                if match.groups():
-                    result.append(match.group(1))
-                else:
-                    result.append(match.group(0))
-
-            return result
+            group = self._group
+            return [match.group(group) for match in self._pattern.finditer(text)]
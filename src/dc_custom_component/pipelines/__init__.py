@@ -1,10 +1,10 @@
 from dc_custom_component.pipelines.github_agent.github_agent import get_agent_pipeline
 
-
 github_agent_config = {
     "name": "github-agent-claude",
     "workspace": "default",
-    "query": get_agent_pipeline(),
+    # Passing the function defers building the pipeline until it is serialized
+    "query": get_agent_pipeline,
 }
 
 dp_pipelines = [
@@ -17,66 +17,92 @@ from dc_custom_component.components.github.pr_creator import GitHubPRCreator
 
 from .system_prompt import system_prompt
 
-
-def get_agent_pipeline() -> Pipeline:
-    view_repo_tool = ComponentTool(
-        component=GithubContentViewer(raise_on_failure=False),
-        name="view_repository",
-        description="Use to explore the contents of the repository.",
-        parameters={
+ANTHROPIC_API_KEY = Secret.from_env_var("ANTHROPIC_API_KEY", strict=False)
+
+# Summary returned as the pipeline's answer once the agent is done
+RESULT_TEMPLATE = "{{['successfully finished in ' ~ messages|length ~ ' steps']}}"
+
+# JSON schemas of the tool arguments; they never change, so they are built once per
+# process
+VIEW_REPOSITORY_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "path": {
+            "type": "string",
+            "description": "The path to the directory or file to view (empty string for root)",
+        }
+    },
+    "required": ["path"],
+}
+
+FILE_EDITOR_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "command": {
+            "type": "string",
+            "description": "The action to perform. One of: 'edit', 'create', 'delete', or 'undo'",
+            "enum": ["edit", "create", "delete", "undo"],
+        },
+        "payload": {
             "type": "object",
+            "description": "The details for the command",
             "properties": {
                 "path": {
                     "type": "string",
-                    "description": "The path to the directory or file to view (empty string for root)",
-                }
+                    "description": "The full path to the file (required for edit, create, and delete commands)",
+                },
+                "original": {
+                    "type": "string",
+                    "description": "The exact text to replace (minimum 2 consecutive lines; required for edit command)",
+                },
+                "replacement": {
+                    "type": "string",
+                    "description": "The new text to insert (required for edit command)",
+                },
+                "content": {
+                    "type": "string",
+                    "description": "The content of the file (required for create command)",
+                },
+                "message": {
+                    "type": "string",
+                    "description": "A descriptive commit message using conventional commit style (required for all commands)",
+                },
             },
-            "required": ["path"],
+            "required": ["message"],
+        },
+    },
+    "required": ["command", "payload"],
+}
+
+CREATE_PR_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "title": {
+            "type": "string",
+            "description": "A concise, descriptive title for the pull request following conventional commit style",
+        },
+        "body": {
+            "type": "string",
+            "description": "A detailed description of the changes made, explaining the approach and implementation details",
         },
+    },
+    "required": ["title", "body"],
+}
+
+
+def get_agent_pipeline() -> Pipeline:
+    view_repo_tool = ComponentTool(
+        component=GithubContentViewer(raise_on_failure=False),
+        name="view_repository",
+        description="Use to explore the contents of the repository.",
+        parameters=VIEW_REPOSITORY_PARAMETERS,
     )
 
     file_editor_tool = ComponentTool(
         component=GithubFileEditor(raise_on_failure=False),
         name="file_editor",
         description="Use the file editor to edit an existing file in the repository.",
-        parameters={
-            "type": "object",
-            "properties": {
-                "command": {
-                    "type": "string",
-                    "description": "The action to perform. One of: 'edit', 'create', 'delete', or 'undo'",
-                    "enum": ["edit", "create", "delete", "undo"],
-                },
-                "payload": {
-                    "type": "object",
-                    "description": "The details for the command",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "The full path to the file (required for edit, create, and delete commands)",
-                        },
-                        "original": {
-                            "type": "string",
-                            "description": "The exact text to replace (minimum 2 consecutive lines; required for edit command)",
-                        },
-                        "replacement": {
-                            "type": "string",
-                            "description": "The new text to insert (required for edit command)",
-                        },
-                        "content": {
-                            "type": "string",
-                            "description": "The content of the file (required for create command)",
-                        },
-                        "message": {
-                            "type": "string",
-                            "description": "A descriptive commit message using conventional commit style (required for all commands)",
-                        },
-                    },
-                    "required": ["message"],
-                },
-            },
-            "required": ["command", "payload"],
-        },
+        parameters=FILE_EDITOR_PARAMETERS,
     )
 
     create_pr_tool = ComponentTool(
@@ -88,26 +114,13 @@ def get_agent_pipeline() -> Pipeline:
             "repo": "repo",
             "issue_url": "issue_url",
         },
-        parameters={
-            "type": "object",
-            "properties": {
-                "title": {
-                    "type": "string",
-                    "description": "A concise, descriptive title for the pull request following conventional commit style",
-                },
-                "body": {
-                    "type": "string",
-                    "description": "A detailed description of the changes made, explaining the approach and implementation details",
-                },
-            },
-            "required": ["title", "body"],
-        },
+        parameters=CREATE_PR_PARAMETERS,
     )
 
     chat_generator = AnthropicChatGenerator(
         model="claude-3-7-sonnet-latest",
         generation_kwargs={"max_tokens": 8000},
-        api_key=Secret.from_env_var("ANTHROPIC_API_KEY", strict=False),
+        api_key=ANTHROPIC_API_KEY,
     )
     agent = Agent(
         chat_generator=chat_generator,
@@ -126,7 +139,7 @@ def get_agent_pipeline() -> Pipeline:
     )
 
     adapter = OutputAdapter(
-        template="{{['successfully finished in ' ~ messages|length ~ ' steps']}}",
+        template=RESULT_TEMPLATE,
         output_type=list[str],
     )
 
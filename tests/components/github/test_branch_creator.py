@@ -0,0 +1,115 @@
+from unittest.mock import Mock, patch
+
+import orjson
+import pytest
+import requests
+from haystack.utils import Secret
+
+from dc_custom_component.components.github.branch_creator import (
+    BRANCH_STATE_QUERY,
+    GRAPHQL_URL,
+    GithubBranchCreator,
+)
+
+ISSUE_URL = "https://github.com/owner/repo/issues/7"
+REFS_URL = "https://api.github.com/repos/owner/repo/git/refs"
+
+
+def _response(status_code: int, payload: dict) -> Mock:
+    response = Mock(status_code=status_code, content=orjson.dumps(payload))
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+    return response
+
+
+def _branch_state(existing_sha: str | None = None) -> Mock:
+    return _response(
+        200,
+        {
+            "data": {
+                "repository": {
+                    "defaultBranchRef": {"name": "main", "target": {"oid": "base"}},
+                    "ref": {"target": {"oid": existing_sha}} if existing_sha else None,
+                }
+            }
+        },
+    )
+
+
+@pytest.fixture
+def creator() -> GithubBranchCreator:
+    return GithubBranchCreator(
+        github_token=Secret.from_token("dummy_token"), fail_if_exists=False
+    )
+
+
+class TestGithubBranchCreator:
+    def test_branch_state_read_in_one_query(self, creator: GithubBranchCreator) -> None:
+        """Test that the default branch head and the existing branch are read with one GraphQL request"""
+        with patch.object(creator, "_session") as mock_session:
+            mock_session.post.return_value = _branch_state(existing_sha="existing")
+            result = creator.run(url=ISSUE_URL)
+
+        assert result == {"branch_name": "fix-issue-7", "created": False}
+        mock_session.post.assert_called_once()
+        mock_session.get.assert_not_called()
+        args, kwargs = mock_session.post.call_args
+        assert args == (GRAPHQL_URL,)
+        assert kwargs["json"] == {
+            "query": BRANCH_STATE_QUERY,
+            "variables": {
+                "owner": "owner",
+                "repo": "repo",
+                "branch": "refs/heads/fix-issue-7",
+            },
+        }
+
+    def test_creates_branch_from_default_branch_head(
+        self, creator: GithubBranchCreator
+    ) -> None:
+        """Test that a missing branch is created at the head of the default branch"""
+        with patch.object(creator, "_session") as mock_session:
+            mock_session.post.side_effect = [_branch_state(), _response(201, {})]
+            result = creator.run(url=ISSUE_URL)
+
+        assert result == {"branch_name": "fix-issue-7", "created": True}
+        args, kwargs = mock_session.post.call_args
+        assert args == (REFS_URL,)
+        assert kwargs["json"] == {"ref": "refs/heads/fix-issue-7", "sha": "base"}
+
+    def test_422_from_replayed_create_is_recovered(
+        self, creator: GithubBranchCreator
+    ) -> None:
+        """Test that a 422 is treated as success when the branch now points at the requested base"""
+        with patch.object(creator, "_session") as mock_session:
+            mock_session.post.side_effect = [
+                _branch_state(),
+                _response(422, {"message": "Reference already exists"}),
+            ]
+            mock_session.get.return_value = _response(200, {"object": {"sha": "base"}})
+            result = creator.run(url=ISSUE_URL)
+
+        assert result == {"branch_name": "fix-issue-7", "created": True}
+        assert mock_session.get.call_args.args == (f"{REFS_URL}/heads/fix-issue-7",)
+
+    def test_422_for_other_branch_head_is_raised(
+        self, creator: GithubBranchCreator
+    ) -> None:
+        """Test that a 422 is raised when the branch exists at another commit"""
+        with patch.object(creator, "_session") as mock_session:
+            mock_session.post.side_effect = [
+                _branch_state(),
+                _response(422, {"message": "Reference already exists"}),
+            ]
+            mock_session.get.return_value = _response(200, {"object": {"sha": "other"}})
+            with pytest.raises(requests.HTTPError):
+                creator.run(url=ISSUE_URL)
+
+    def test_graphql_errors_are_raised(self, creator: GithubBranchCreator) -> None:
+        """Test that GraphQL errors reported with a 200 response are not ignored"""
+        with patch.object(creator, "_session") as mock_session:
+            mock_session.post.return_value = _response(
+                200, {"errors": [{"message": "Could not resolve to a Repository"}]}
+            )
+            with pytest.raises(RuntimeError, match="Could not resolve"):
+                creator.run(url=ISSUE_URL)
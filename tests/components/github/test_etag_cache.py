@@ -0,0 +1,16 @@
+from dc_custom_component.components.github.etag_cache import ETagCache
+
+
+class TestETagCache:
+    def test_evicts_least_recently_used_entry(self) -> None:
+        """Test that a full cache evicts the entry that was stored or refreshed longest ago"""
+        cache = ETagCache(max_entries=2)
+        cache.put("a", '"a1"', {"name": "a"})
+        cache.put("b", '"b1"', {"name": "b"})
+        # Refreshing a makes b the least recently used entry
+        cache.put("a", '"a2"', {"name": "a"})
+        cache.put("c", '"c1"', {"name": "c"})
+
+        assert cache.get("a") == ('"a2"', {"name": "a"})
+        assert cache.get("b") is None
+        assert cache.get("c") == ('"c1"', {"name": "c"})
@@ -0,0 +1,103 @@
+from unittest.mock import patch
+
+from haystack import Document, Pipeline
+from haystack.dataclasses import ChatMessage
+from haystack.utils import Secret
+
+from dc_custom_component.components.github.fetch_issues import FetchIssue
+from dc_custom_component.components.github.issue_viewer import GithubIssueViewer
+
+ISSUE_URL = "https://github.com/owner/repo/issues/1"
+
+
+def _issue_documents() -> list:
+    return [
+        Document(content="The build fails", meta={"type": "issue", "number": 1}),
+        Document(content="Can reproduce", meta={"type": "comment"}),
+    ]
+
+
+class TestFetchIssue:
+    def test_serialization_builds_pipeline_once(self) -> None:
+        """Test that to_dict does not touch the wrapped pipeline and from_dict builds it exactly once"""
+        fetch_issue = FetchIssue(
+            github_token=Secret.from_env_var("GITHUB_TOKEN", strict=False),
+            assistant_pattern="@agent-message",
+            strip_role_prefix=False,
+        )
+
+        with (
+            patch(
+                "dc_custom_component.components.github.fetch_issues.Pipeline"
+            ) as mock_pipeline,
+            patch(
+                "dc_custom_component.components.github.fetch_issues.GithubIssueViewer",
+                wraps=GithubIssueViewer,
+            ) as mock_viewer,
+        ):
+            data = fetch_issue.to_dict()
+            assert not mock_pipeline.called
+            assert not mock_viewer.called
+
+        assert data["init_parameters"]["assistant_pattern"] == "@agent-message"
+        assert data["init_parameters"]["strip_role_prefix"] is False
+
+        with patch(
+            "dc_custom_component.components.github.fetch_issues.GithubIssueViewer",
+            wraps=GithubIssueViewer,
+        ) as mock_viewer:
+            restored = FetchIssue.from_dict(data)
+            assert mock_viewer.call_count == 1
+
+        assert restored.assistant_pattern == "@agent-message"
+        assert restored.strip_role_prefix is False
+
+    def test_run_fetches_issue_and_creates_branch(self) -> None:
+        """Test that run passes the URL to the viewer and the branch creator and converts the documents"""
+        fetch_issue = FetchIssue(github_token=Secret.from_token("dummy_token"))
+
+        with (
+            patch.object(
+                fetch_issue._fetcher,
+                "run",
+                return_value={"documents": _issue_documents()},
+            ) as mock_fetch,
+            patch.object(
+                fetch_issue._branch_creator,
+                "run",
+                return_value={"branch_name": "fix-issue-1", "created": True},
+            ) as mock_create,
+        ):
+            result = fetch_issue.run(url=ISSUE_URL)
+
+        mock_fetch.assert_called_once_with(url=ISSUE_URL)
+        mock_create.assert_called_once_with(url=ISSUE_URL)
+        assert result["branch"] == "fix-issue-1"
+        assert [message.text for message in result["messages"]] == [
+            "The build fails",
+            "Can reproduce",
+        ]
+        assert all(isinstance(m, ChatMessage) for m in result["messages"])
+
+    def test_run_inside_pipeline(self) -> None:
+        """Test that the run override keeps the sockets the wrapped pipeline declares"""
+        fetch_issue = FetchIssue(github_token=Secret.from_token("dummy_token"))
+        pipeline = Pipeline()
+        pipeline.add_component("issue_fetcher", fetch_issue)
+
+        with (
+            patch.object(
+                fetch_issue._fetcher,
+                "run",
+                return_value={"documents": _issue_documents()},
+            ),
+            patch.object(
+                fetch_issue._branch_creator,
+                "run",
+                return_value={"branch_name": "fix-issue-1", "created": False},
+            ),
+        ):
+            result = pipeline.run({"issue_fetcher": {"url": ISSUE_URL}})
+
+        assert result["issue_fetcher"]["branch"] == "fix-issue-1"
+        assert len(result["issue_fetcher"]["messages"]) == 2
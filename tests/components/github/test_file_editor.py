@@ -1,65 +1,65 @@
-from base64 import b64encode
+import hashlib
+import io
+import json
+from base64 import b64decode, b64encode
+from typing import Any, Callable
 from unittest.mock import Mock, patch
 
 import pytest
-from requests import RequestException
+from requests import HTTPError, RequestException, Response
+from urllib3 import HTTPResponse
 
 from dc_custom_component.components.github.file_editor import Command, GithubFileEditor
 from haystack.utils import Secret
 
+# Base64 payloads the editor is expected to send, encoded once for all tests
+NEW_CONTENT_B64 = b64encode(b"new content").decode("utf-8")
+NEW_FUNCTION_B64 = b64encode(b"def new_function():\n    return 'new'").decode("utf-8")
 
-class TestGithubFileEditor:
-    @pytest.fixture
-    def mock_responses(self) -> dict:
-        """Setup mock responses for API calls"""
-        # Mock file content response
-        file_content_response = Mock()
-        file_content_response.json.return_value = {
-            "content": b64encode(b"def old_function():\n    return 'old'").decode(
-                "utf-8"
-            ),
-            "sha": "abc123",
-        }
-        file_content_response.raise_for_status = Mock()
-
-        # Mock update file response
-        update_file_response = Mock()
-        update_file_response.raise_for_status = Mock()
-        update_file_response.json.return_value = {"commit": {"sha": "def456"}}
-
-        # Mock commits response
-        commits_response = Mock()
-        commits_response.json.return_value = [
-            {"sha": "current_sha", "author": {"login": "current_user"}},
-            {"sha": "previous_sha", "author": {"login": "different_user"}},
-        ]
-        commits_response.raise_for_status = Mock()
 
-        # Mock user response
-        user_response = Mock()
-        user_response.json.return_value = {"login": "current_user"}
-        user_response.raise_for_status = Mock()
+def _raw_response(status: int, body: bytes) -> HTTPResponse:
+    """Build the urllib3 response a connection returns, below the adapter's retries"""
+    return HTTPResponse(
+        body=io.BytesIO(body), status=status, headers={}, preload_content=False
+    )
+
 
-        # Mock branch update response
-        branch_update_response = Mock()
-        branch_update_response.raise_for_status = Mock()
+def _route_by_url(responses: dict) -> Callable[..., Mock]:
+    """Build a side effect returning the mock response registered for the requested URL"""
+    return lambda url, **kwargs: responses[url]
 
-        # Mock create file response
-        create_file_response = Mock()
-        create_file_response.raise_for_status = Mock()
 
-        # Mock delete file response
-        delete_file_response = Mock()
-        delete_file_response.raise_for_status = Mock()
+def _ok(json_payload: Any = None, **attributes: Any) -> Mock:
+    """Build a successful response mock; its spec rejects attributes a real Response does not have"""
+    response = Mock(spec=Response)
+    response.status_code = 200
+    response.headers = {}
+    response.json.return_value = json_payload
+    for name, value in attributes.items():
+        setattr(response, name, value)
+    return response
 
+
+class TestGithubFileEditor:
+    @pytest.fixture
+    def mock_responses(self) -> dict:
+        """Setup mock responses for API calls"""
         return {
-            "file_content": file_content_response,
-            "update_file": update_file_response,
-            "commits": commits_response,
-            "user": user_response,
-            "branch_update": branch_update_response,
-            "create_file": create_file_response,
-            "delete_file": delete_file_response,
+            "file_content": _ok(
+                headers={"ETag": '"old_etag"'},
+                content=b"def old_function():\n    return 'old'",
+            ),
+            "update_file": _ok({"commit": {"sha": "def456"}}),
+            "commits": _ok(
+                [
+                    {"sha": "current_sha", "author": {"login": "current_user"}},
+                    {"sha": "previous_sha", "author": {"login": "different_user"}},
+                ]
+            ),
+            "user": _ok({"login": "current_user"}),
+            "branch_update": _ok(),
+            "create_file": _ok(),
+            "delete_file": _ok(),
         }
 
     @pytest.fixture
@@ -95,9 +95,9 @@ class TestGithubFileEditor:
     def test_init_with_invalid_token_type(self) -> None:
         """Test initialization with invalid token type"""
         with pytest.raises(TypeError, match="github_token must be a Secret"):
-            GithubFileEditor(github_token="not_a_secret")
+            GithubFileEditor(github_token="not_a_secret")  # type: ignore[arg-type]
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_file_content(
         self, mock_get: Mock, editor: GithubFileEditor, mock_responses: dict
     ) -> None:
@@ -109,14 +109,74 @@ class TestGithubFileEditor:
         )
 
         assert content == "def old_function():\n    return 'old'"
-        assert sha == "abc123"
+        # Git blob SHA of the content, as `git hash-object` computes it
+        assert sha == "8d75b0351a61b2676bd050ae72549336c563a339"
         mock_get.assert_called_once_with(
             "https://api.github.com/repos/owner/repo/contents/path/to/file.py",
-            headers=editor.headers,
+            headers={**editor.headers, "Accept": "application/vnd.github.raw+json"},
             params={"ref": "main"},
+            timeout=editor._timeout,
         )
 
-    @patch("requests.put")
+    @patch("dc_custom_component.components.github.file_editor.time.monotonic")
+    @patch("requests.Session.get")
+    def test_get_file_content_304_uses_cache(
+        self,
+        mock_get: Mock,
+        mock_monotonic: Mock,
+        editor: GithubFileEditor,
+        mock_responses: dict,
+    ) -> None:
+        """Test that an expired file is revalidated with its ETag and served from the cache on 304"""
+        not_modified_response = Mock()
+        not_modified_response.status_code = 304
+        mock_get.side_effect = [mock_responses["file_content"], not_modified_response]
+
+        mock_monotonic.return_value = 0.0
+        first = editor._get_file_content("owner", "repo", "path/to/file.py", "main")
+        mock_monotonic.return_value = 1000.0
+        second = editor._get_file_content("owner", "repo", "path/to/file.py", "main")
+
+        assert second == first
+        assert mock_get.call_count == 2
+        assert mock_get.call_args[1]["headers"]["If-None-Match"] == '"old_etag"'
+        not_modified_response.raise_for_status.assert_not_called()
+
+    def test_requests_share_pooled_session(
+        self, editor: GithubFileEditor, mock_responses: dict
+    ) -> None:
+        """Test that all editors send their requests through one keep-alive session"""
+        other = GithubFileEditor(github_token=Secret.from_token("other_token"))
+        assert other._session is editor._session
+
+        with patch.object(editor, "_session") as mock_session:
+            mock_session.get.return_value = mock_responses["file_content"]
+            editor._get_file_content("owner", "repo", "path/to/a.py", "main")
+            editor._get_file_content("owner", "repo", "path/to/b.py", "main")
+
+        assert mock_session.get.call_count == 2
+
+    @patch("requests.Session.close")
+    def test_close_keeps_shared_session_open(
+        self, mock_close: Mock, editor: GithubFileEditor
+    ) -> None:
+        """Test that closing one editor drops its cache without closing the session other editors use"""
+        editor._cache_file("owner", "repo", "a.py", "main", "content", "sha")
+        editor.close()
+
+        assert editor._file_cache == {}
+        mock_close.assert_not_called()
+
+    @patch("requests.Session.close")
+    def test_context_manager_closes_editor(self, mock_close: Mock) -> None:
+        """Test that leaving the context manager closes the editor but not the shared session"""
+        with GithubFileEditor(github_token=Secret.from_token("dummy_token")) as editor:
+            assert isinstance(editor, GithubFileEditor)
+            editor._cache_file("owner", "repo", "a.py", "main", "content", "sha")
+        assert editor._file_cache == {}
+        mock_close.assert_not_called()
+
+    @patch("requests.Session.put")
     def test_update_file(
         self, mock_put: Mock, editor: GithubFileEditor, mock_responses: dict
     ) -> None:
@@ -148,52 +208,117 @@ class TestGithubFileEditor:
         assert payload["sha"] == "abc123"
         assert payload["branch"] == "main"
         # Verify content is base64 encoded
-        assert payload["content"] == b64encode(b"new content").decode("utf-8")
+        assert payload["content"] == NEW_CONTENT_B64
+
+    @patch("requests.Session.put")
+    @patch("requests.Session.get")
+    def test_file_content_cached_after_update(
+        self,
+        mock_get: Mock,
+        mock_put: Mock,
+        editor: GithubFileEditor,
+        mock_responses: dict,
+    ) -> None:
+        """Test that a file read or written by the editor is served from the cache"""
+        mock_get.return_value = mock_responses["file_content"]
+        update_response = _ok({"content": {"sha": "def456"}})
+        mock_put.return_value = update_response
+
+        editor._get_file_content("owner", "repo", "path/to/file.py", "main")
+        editor._update_file(
+            "owner",
+            "repo",
+            "path/to/file.py",
+            "new content",
+            "Update message",
+            "abc123",
+            "main",
+        )
+        content, sha = editor._get_file_content(
+            "owner", "repo", "path/to/file.py", "main"
+        )
 
-    @patch("requests.get")
+        assert content == "new content"
+        assert sha == "def456"
+        mock_get.assert_called_once()
+
+    @patch("requests.Session.get")
     def test_check_last_commit_same_user(
         self, mock_get: Mock, editor: GithubFileEditor, mock_responses: dict
     ) -> None:
         """Test checking if last commit was made by current user (success case)"""
-        # Setup mocks to return responses in the correct order
-        mock_get.side_effect = [mock_responses["commits"], mock_responses["user"]]
+        # Commits and user are fetched concurrently, so responses are routed by URL
+        mock_get.side_effect = _route_by_url(
+            {
+                "https://api.github.com/repos/owner/repo/commits": mock_responses[
+                    "commits"
+                ],
+                "https://api.github.com/user": mock_responses["user"],
+            }
+        )
 
-        result = editor._check_last_commit("owner", "repo", "main")
+        is_own_commit, commits = editor._check_last_commit("owner", "repo", "main")
 
-        assert result is True
+        assert is_own_commit is True
+        assert commits == mock_responses["commits"].json.return_value
         assert mock_get.call_count == 2
-        # Check first call for commits
-        args1, kwargs1 = mock_get.call_args_list[0]
-        assert args1[0] == "https://api.github.com/repos/owner/repo/commits"
-        assert kwargs1["params"] == {"per_page": 1, "sha": "main"}
-        # Check second call for user
-        args2, kwargs2 = mock_get.call_args_list[1]
-        assert args2[0] == "https://api.github.com/user"
-
-    @patch("requests.get")
+        calls = {args[0]: kwargs for args, kwargs in mock_get.call_args_list}
+        assert calls.keys() == {
+            "https://api.github.com/repos/owner/repo/commits",
+            "https://api.github.com/user",
+        }
+        assert calls["https://api.github.com/repos/owner/repo/commits"]["params"] == {
+            "per_page": 2,
+            "sha": "main",
+        }
+
+    @patch("requests.Session.get")
     def test_check_last_commit_different_user(
         self, mock_get: Mock, editor: GithubFileEditor, mock_responses: dict
     ) -> None:
         """Test checking if last commit was made by different user"""
         # First response for commits
-        commits_response = Mock()
-        commits_response.json.return_value = [
-            {"author": {"login": "different_user"}, "sha": "abc123"}
-        ]
-        commits_response.raise_for_status = Mock()
+        commits_response = _ok(
+            [{"author": {"login": "different_user"}, "sha": "abc123"}]
+        )
 
         # Second response for user
-        user_response = Mock()
-        user_response.json.return_value = {"login": "current_user"}
-        user_response.raise_for_status = Mock()
+        user_response = _ok({"login": "current_user"})
 
-        mock_get.side_effect = [commits_response, user_response]
+        mock_get.side_effect = _route_by_url(
+            {
+                "https://api.github.com/repos/owner/repo/commits": commits_response,
+                "https://api.github.com/user": user_response,
+            }
+        )
 
-        result = editor._check_last_commit("owner", "repo", "main")
+        is_own_commit, _ = editor._check_last_commit("owner", "repo", "main")
 
-        assert result is False
+        assert is_own_commit is False
         assert mock_get.call_count == 2
 
+    @patch("requests.Session.get")
+    def test_check_last_commit_caches_user(
+        self, mock_get: Mock, editor: GithubFileEditor, mock_responses: dict
+    ) -> None:
+        """Test that the current user is only fetched on the first check"""
+        mock_get.side_effect = _route_by_url(
+            {
+                "https://api.github.com/repos/owner/repo/commits": mock_responses[
+                    "commits"
+                ],
+                "https://api.github.com/user": mock_responses["user"],
+            }
+        )
+
+        assert editor._check_last_commit("owner", "repo", "main")[0] is True
+        assert editor._check_last_commit("owner", "repo", "main")[0] is True
+        assert mock_get.call_count == 3
+        assert (
+            mock_get.call_args_list[2][0][0]
+            == "https://api.github.com/repos/owner/repo/commits"
+        )
+
     @patch(
         "dc_custom_component.components.github.file_editor.GithubFileEditor._get_file_content"
     )
@@ -234,6 +359,78 @@ class TestGithubFileEditor:
             "main",
         )
 
+    @patch(
+        "dc_custom_component.components.github.file_editor.GithubFileEditor._get_file_content"
+    )
+    @patch(
+        "dc_custom_component.components.github.file_editor.GithubFileEditor._update_file"
+    )
+    def test_edit_file_retries_on_conflict(
+        self, mock_update: Mock, mock_get_content: Mock, editor: GithubFileEditor
+    ) -> None:
+        """Test that an edit is re-applied once when the file changed in between"""
+        mock_get_content.side_effect = [
+            ("def old_function():\n    return 'old'", "stale_sha"),
+            ("# header\ndef old_function():\n    return 'old'", "fresh_sha"),
+        ]
+        mock_update.side_effect = [HTTPError(response=Mock(status_code=409)), True]
+
+        payload = {
+            "path": "path/to/file.py",
+            "original": "def old_function():",
+            "replacement": "def new_function():",
+            "message": "Updated function",
+        }
+
+        result = editor._edit_file("owner", "repo", payload, "main")
+
+        assert result == "Edit successful"
+        assert mock_get_content.call_count == 2
+        mock_update.assert_called_with(
+            "owner",
+            "repo",
+            "path/to/file.py",
+            "# header\ndef new_function():\n    return 'old'",
+            "Updated function",
+            "fresh_sha",
+            "main",
+        )
+
+    def test_edit_file_applied_put_answered_with_502_is_not_replayed(
+        self, editor: GithubFileEditor
+    ) -> None:
+        """Test that a PUT which was applied but answered with a 502 is not replayed"""
+        server: dict[str, Any] = {"content": b"a\nb\n", "puts": 0}
+
+        def make_request(
+            pool: Any, conn: Any, method: str, url: str, body: Any = None, **kwargs: Any
+        ) -> HTTPResponse:
+            if method == "GET":
+                return _raw_response(200, server["content"])
+            server["puts"] += 1
+            payload = json.loads(body)
+            if payload["sha"] != hashlib.sha1(b"blob 4\x00a\nb\n").hexdigest():
+                return _raw_response(409, b"{}")
+            # The commit is made, but the gateway answers with a 502
+            server["content"] = b64decode(payload["content"])
+            return _raw_response(502, b"")
+
+        payload = {
+            "path": "file.txt",
+            "original": "a\nb\n",
+            "replacement": "a\nb\nc\n",
+            "message": "Append c",
+        }
+        with patch(
+            "urllib3.connectionpool.HTTPConnectionPool._make_request",
+            autospec=True,
+            side_effect=make_request,
+        ):
+            with pytest.raises(HTTPError):
+                editor._edit_file("owner", "repo", payload, "main")
+
+        assert server == {"content": b"a\nb\nc\n", "puts": 1}
+
     @patch(
         "dc_custom_component.components.github.file_editor.GithubFileEditor._get_file_content"
     )
@@ -283,10 +480,38 @@ class TestGithubFileEditor:
         )
         mock_get_content.assert_called_once()
 
+    @patch("requests.Session.put")
+    @patch("requests.Session.get")
+    def test_edit_file_revalidates_stale_cache_before_reporting_not_found(
+        self, mock_get: Mock, mock_put: Mock, editor: GithubFileEditor
+    ) -> None:
+        """Test that a string missing from a cached copy is looked up again in the current file"""
+        editor._cache_file(
+            "owner", "repo", "file.py", "main", "old\n", "stale_sha", '"stale"'
+        )
+        mock_get.return_value = _ok(headers={"ETag": '"fresh"'}, content=b"new\n")
+        mock_put.return_value = _ok({"content": {"sha": "edited_sha"}})
+
+        payload = {
+            "path": "file.py",
+            "original": "new",
+            "replacement": "newer",
+            "message": "Edit",
+        }
+        result = editor._edit_file("owner", "repo", payload, "main")
+
+        assert result == "Edit successful"
+        mock_get.assert_called_once()
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"stale"'
+        assert (
+            mock_put.call_args.kwargs["json"]["sha"]
+            == hashlib.sha1(b"blob 4\x00new\n").hexdigest()
+        )
+
     @patch(
         "dc_custom_component.components.github.file_editor.GithubFileEditor._get_file_content"
     )
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_edit_file_request_exception(
         self, mock_put: Mock, mock_get_content: Mock, editor: GithubFileEditor
     ) -> None:
@@ -317,8 +542,8 @@ class TestGithubFileEditor:
     @patch(
         "dc_custom_component.components.github.file_editor.GithubFileEditor._check_last_commit"
     )
-    @patch("requests.get")
-    @patch("requests.patch")
+    @patch("requests.Session.get")
+    @patch("requests.Session.patch")
     def test_undo_changes_success(
         self,
         mock_patch: Mock,
@@ -328,8 +553,10 @@ class TestGithubFileEditor:
         mock_responses: dict,
     ) -> None:
         """Test successful undoing of changes"""
-        mock_check_commit.return_value = True
-        mock_get.return_value = mock_responses["commits"]
+        mock_check_commit.return_value = (
+            True,
+            mock_responses["commits"].json.return_value,
+        )
         mock_patch.return_value = mock_responses["branch_update"]
 
         payload = {"message": "Undo last change"}
@@ -338,7 +565,8 @@ class TestGithubFileEditor:
 
         assert result == "Successfully undid last change"
         mock_check_commit.assert_called_once_with("owner", "repo", "main")
-        mock_get.assert_called_once()
+        # The previous commit comes from the commits fetched by the check
+        mock_get.assert_not_called()
         mock_patch.assert_called_once()
         # Verify patch call args
         args, kwargs = mock_patch.call_args
@@ -347,6 +575,23 @@ class TestGithubFileEditor:
         assert kwargs["json"]["sha"] == "previous_sha"
         assert kwargs["json"]["force"] is True
 
+    def test_undo_changes_single_commits_request(
+        self, editor: GithubFileEditor, mock_responses: dict
+    ) -> None:
+        """Test that an undo reads the commits once and then moves the branch"""
+        editor._current_user = "current_user"
+        with patch.object(editor, "_session") as mock_session:
+            mock_session.get.return_value = mock_responses["commits"]
+            mock_session.patch.return_value = mock_responses["branch_update"]
+
+            result = editor._undo_changes(
+                "owner", "repo", {"message": "Undo last change"}, "main"
+            )
+
+        assert result == "Successfully undid last change"
+        assert mock_session.get.call_count + mock_session.patch.call_count == 2
+        assert mock_session.patch.call_args[1]["json"]["sha"] == "previous_sha"
+
     @patch(
         "dc_custom_component.components.github.file_editor.GithubFileEditor._check_last_commit"
     )
@@ -354,7 +599,10 @@ class TestGithubFileEditor:
         self, mock_check_commit: Mock, editor: GithubFileEditor
     ) -> None:
         """Test undo when last commit was not from same user"""
-        mock_check_commit.return_value = False
+        mock_check_commit.return_value = (
+            False,
+            [{"sha": "abc123", "author": {"login": "different_user"}}],
+        )
 
         payload = {"message": "Undo last change"}
 
@@ -366,13 +614,20 @@ class TestGithubFileEditor:
     @patch(
         "dc_custom_component.components.github.file_editor.GithubFileEditor._check_last_commit"
     )
-    @patch("requests.get")
+    @patch("requests.Session.patch")
     def test_undo_changes_request_exception(
-        self, mock_get: Mock, mock_check_commit: Mock, editor: GithubFileEditor
+        self,
+        mock_patch: Mock,
+        mock_check_commit: Mock,
+        editor: GithubFileEditor,
+        mock_responses: dict,
     ) -> None:
         """Test undo with request exception"""
-        mock_check_commit.return_value = True
-        mock_get.side_effect = RequestException("API error")
+        mock_check_commit.return_value = (
+            True,
+            mock_responses["commits"].json.return_value,
+        )
+        mock_patch.side_effect = RequestException("API error")
 
         payload = {"message": "Undo last change"}
 
@@ -386,7 +641,7 @@ class TestGithubFileEditor:
         result = editor._undo_changes("owner", "repo", payload, "main")
         assert result == "Error: API error"
 
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_create_file_success(
         self, mock_put: Mock, editor: GithubFileEditor, mock_responses: dict
     ) -> None:
@@ -413,12 +668,9 @@ class TestGithubFileEditor:
         assert kwargs["json"]["message"] == "Add new file"
         assert kwargs["json"]["branch"] == "main"
         # Verify content is base64 encoded
-        expected_content = b64encode(b"def new_function():\n    return 'new'").decode(
-            "utf-8"
-        )
-        assert kwargs["json"]["content"] == expected_content
+        assert kwargs["json"]["content"] == NEW_FUNCTION_B64
 
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_create_file_request_exception(
         self, mock_put: Mock, editor: GithubFileEditor
     ) -> None:
@@ -444,7 +696,7 @@ class TestGithubFileEditor:
     @patch(
         "dc_custom_component.components.github.file_editor.GithubFileEditor._get_file_content"
     )
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_delete_file_success(
         self,
         mock_delete: Mock,
@@ -476,10 +728,32 @@ class TestGithubFileEditor:
         assert kwargs["json"]["sha"] == "abc123"
         assert kwargs["json"]["branch"] == "main"
 
+    @patch("requests.Session.delete")
+    @patch("requests.Session.get")
+    def test_delete_file_retries_once_with_stale_cached_sha(
+        self, mock_get: Mock, mock_delete: Mock, editor: GithubFileEditor
+    ) -> None:
+        """Test that a 409 for a SHA served from the cache re-reads the file and deletes again"""
+        editor._cache_file("owner", "repo", "file.py", "main", "old\n", "stale_sha")
+        mock_get.return_value = _ok(content=b"new\n")
+        conflict = _ok()
+        conflict.status_code = 409
+        mock_delete.side_effect = [conflict, _ok()]
+
+        payload = {"path": "file.py", "message": "Delete file"}
+        result = editor._delete_file("owner", "repo", payload, "main")
+
+        assert result == "File deleted successfully"
+        mock_get.assert_called_once()
+        assert [c.kwargs["json"]["sha"] for c in mock_delete.call_args_list] == [
+            "stale_sha",
+            hashlib.sha1(b"blob 4\x00new\n").hexdigest(),
+        ]
+
     @patch(
         "dc_custom_component.components.github.file_editor.GithubFileEditor._get_file_content"
     )
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_delete_file_request_exception(
         self, mock_delete: Mock, mock_get_content: Mock, editor: GithubFileEditor
     ) -> None:
@@ -599,6 +873,148 @@ class TestGithubFileEditor:
             assert result["result"] == "Edit successful"
             mock_edit.assert_called_once_with("custom", "repo", payload, "feature")
 
+    @patch("requests.Session.post")
+    def test_run_batch_single_commit(
+        self, mock_post: Mock, editor: GithubFileEditor
+    ) -> None:
+        """Test that batched commands are read in one query and written in one commit"""
+        files_response = _ok(
+            {
+                "data": {
+                    "repository": {
+                        "ref": {"target": {"oid": "head_sha"}},
+                        "f0": {
+                            "text": "def old_function():\n    return 'old'",
+                            "isBinary": False,
+                            "isTruncated": False,
+                        },
+                        "f1": {
+                            "text": "obsolete",
+                            "isBinary": False,
+                            "isTruncated": False,
+                        },
+                        "f2": None,
+                    }
+                }
+            }
+        )
+        commit_response = _ok(
+            {"data": {"createCommitOnBranch": {"commit": {"oid": "new_sha"}}}}
+        )
+        mock_post.side_effect = [files_response, commit_response]
+
+        commands = [
+            {
+                "command": "edit",
+                "payload": {
+                    "path": "path/to/file.py",
+                    "original": "old_function",
+                    "replacement": "new_function",
+                },
+            },
+            {"command": Command.DELETE, "payload": {"path": "path/to/old.py"}},
+            {
+                "command": "create",
+                "payload": {"path": "path/to/new.py", "content": "new file"},
+            },
+        ]
+
+        result = editor.run_batch(commands, message="Refactor")
+
+        assert result["result"] == "Committed 3 changes successfully"
+        assert mock_post.call_count == 2
+        variables = mock_post.call_args_list[0][1]["json"]["variables"]
+        assert variables["e0"] == "main:path/to/file.py"
+        commit_input = mock_post.call_args_list[1][1]["json"]["variables"]["input"]
+        assert commit_input["expectedHeadOid"] == "head_sha"
+        assert commit_input["branch"] == {
+            "repositoryNameWithOwner": "owner/repo",
+            "branchName": "main",
+        }
+        assert commit_input["message"] == {"headline": "Refactor"}
+        assert commit_input["fileChanges"]["additions"] == [
+            {
+                "path": "path/to/file.py",
+                "contents": b64encode(b"def new_function():\n    return 'old'").decode(
+                    "utf-8"
+                ),
+            },
+            {
+                "path": "path/to/new.py",
+                "contents": b64encode(b"new file").decode("utf-8"),
+            },
+        ]
+        assert commit_input["fileChanges"]["deletions"] == [{"path": "path/to/old.py"}]
+
+    @patch("requests.Session.post")
+    def test_run_batch_edit_requires_unique_original(
+        self, mock_post: Mock, editor: GithubFileEditor
+    ) -> None:
+        """Test that a batched edit is rejected unless the original string occurs exactly once"""
+        files_response = _ok(
+            {
+                "data": {
+                    "repository": {
+                        "ref": {"target": {"oid": "head_sha"}},
+                        "f0": {
+                            "text": "old = 1\nold = 2",
+                            "isBinary": False,
+                            "isTruncated": False,
+                        },
+                    }
+                }
+            }
+        )
+        mock_post.return_value = files_response
+
+        def edit(original: str) -> list:
+            return [
+                {
+                    "command": "edit",
+                    "payload": {
+                        "path": "a.py",
+                        "original": original,
+                        "replacement": "new",
+                    },
+                }
+            ]
+
+        result = editor.run_batch(edit("old"), message="Edit")
+        assert (
+            result["result"]
+            == "Error: Original string appears multiple times in a.py. Please provide more context"
+        )
+        result = editor.run_batch(edit("missing"), message="Edit")
+        assert result["result"] == "Error: Original string not found in a.py"
+        # Only the reads were sent, no commit
+        assert mock_post.call_count == 2
+
+    @patch("requests.Session.post")
+    def test_run_batch_reports_missing_payload_keys(
+        self, mock_post: Mock, editor: GithubFileEditor
+    ) -> None:
+        """Test that a command without a required payload key returns an error result instead of raising"""
+        result = editor.run_batch(
+            [{"command": "edit", "payload": {"original": "old"}}], message="Edit"
+        )
+        assert (
+            result["result"]
+            == "Error: Missing path, replacement in payload of command 'edit'"
+        )
+
+        result = editor.run_batch([{"command": "delete"}], message="Delete")
+        assert result["result"] == "Error: Missing path in payload of command 'delete'"
+        mock_post.assert_not_called()
+
+    @patch("requests.Session.post")
+    def test_run_batch_rejects_undo(
+        self, mock_post: Mock, editor: GithubFileEditor
+    ) -> None:
+        """Test that undo cannot be part of a batch"""
+        result = editor.run_batch([{"command": "undo", "payload": {}}], message="Undo")
+        assert result["result"] == "Error: Command 'undo' cannot be batched"
+        mock_post.assert_not_called()
+
     def test_to_dict(self, editor: GithubFileEditor) -> None:
         """Test serialization to dictionary"""
         # Mock the to_dict method on the Secret object to prevent serialization error
@@ -0,0 +1,80 @@
+from unittest.mock import Mock, patch
+
+import orjson
+from haystack import Document
+from haystack.utils import Secret
+
+from dc_custom_component.components.github.issue_viewer import GithubIssueViewer
+
+
+def _graphql_issue(number: int, comments: list) -> dict:
+    return {
+        "title": f"Issue {number}",
+        "body": f"Body of issue {number}",
+        "number": number,
+        "state": "OPEN",
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-02T00:00:00Z",
+        "url": f"https://github.com/owner/repo/issues/{number}",
+        "author": {"login": "reporter"},
+        "comments": {"nodes": comments},
+    }
+
+
+class TestGithubIssueViewer:
+    def test_run_many_batches_issues_in_one_query(self) -> None:
+        """Test that issues are read with one GraphQL query and unresolved ones fall back to run()"""
+        viewer = GithubIssueViewer(github_token=Secret.from_token("dummy_token"))
+        comment = {
+            "body": "A comment",
+            "createdAt": "2024-01-03T00:00:00Z",
+            "updatedAt": "2024-01-03T00:00:00Z",
+            "url": "https://github.com/owner/repo/issues/1#issuecomment-10",
+            "author": None,
+        }
+        response = Mock(status_code=200)
+        response.content = orjson.dumps(
+            {
+                "data": {
+                    "r0": {
+                        "i1": _graphql_issue(1, [comment]),
+                        "i2": None,
+                        "i3": _graphql_issue(3, []),
+                    }
+                }
+            }
+        )
+        fallback = Document(
+            content="Pull request 2", meta={"type": "issue", "number": 2}
+        )
+
+        with (
+            patch.object(viewer, "_session") as mock_session,
+            patch.object(
+                viewer, "run", return_value={"documents": [fallback]}
+            ) as mock_run,
+        ):
+            mock_session.post.return_value = response
+            documents = viewer.run_many(
+                [
+                    "https://github.com/owner/repo/issues/1",
+                    "https://github.com/owner/repo/issues/2",
+                    "https://github.com/owner/repo/issues/3",
+                ]
+            )["documents"]
+
+        mock_session.post.assert_called_once()
+        mock_session.get.assert_not_called()
+        mock_run.assert_called_once_with(url="https://github.com/owner/repo/issues/2")
+        assert [doc.meta["type"] for doc in documents] == [
+            "issue",
+            "comment",
+            "issue",
+            "issue",
+        ]
+        assert documents[0].meta["state"] == "open"
+        assert documents[0].meta["author"] == "reporter"
+        assert documents[1].meta["author"] == "ghost"
+        assert documents[1].meta["issue_number"] == 1
+        assert documents[2] is fallback
+        assert documents[3].meta["number"] == 3
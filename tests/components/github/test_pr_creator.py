@@ -0,0 +1,87 @@
+import io
+import json
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from haystack.utils import Secret
+from urllib3 import HTTPResponse
+
+from dc_custom_component.components.github.pr_creator import GitHubPRCreator
+
+PULL_REQUEST = {"html_url": "https://github.com/owner/repo/pull/5", "number": 5}
+
+
+def _raw_response(status: int, payload: Any, retries: Any = None) -> HTTPResponse:
+    """Build the urllib3 response a connection returns, below the adapter's retries"""
+    # Like HTTPConnectionPool._make_request, attach the retry state of the request
+    return HTTPResponse(
+        body=io.BytesIO(json.dumps(payload).encode()),
+        status=status,
+        headers={"Content-Type": "application/json"},
+        preload_content=False,
+        retries=retries,
+    )
+
+
+@pytest.fixture
+def creator() -> GitHubPRCreator:
+    return GitHubPRCreator(repo="owner/repo", github_token=Secret.from_token("dummy"))
+
+
+class TestGitHubPRCreator:
+    def test_replayed_create_answered_with_422_returns_existing_pr(
+        self, creator: GitHubPRCreator
+    ) -> None:
+        """Test that a PR opened by an attempt answered with a 502 is returned when the replay gets a 422"""
+        requests_seen: list = []
+
+        def make_request(
+            pool: Any, conn: Any, method: str, url: str, **kwargs: Any
+        ) -> HTTPResponse:
+            requests_seen.append((method, url))
+            if method == "GET":
+                return _raw_response(200, [PULL_REQUEST], kwargs["retries"])
+            if len(requests_seen) == 1:
+                # The PR is opened, but the gateway answers with a 502
+                return _raw_response(502, {}, kwargs["retries"])
+            return _raw_response(
+                422, {"message": "A pull request already exists"}, kwargs["retries"]
+            )
+
+        with (
+            patch(
+                "urllib3.connectionpool.HTTPConnectionPool._make_request",
+                autospec=True,
+                side_effect=make_request,
+            ),
+            patch("time.sleep"),
+        ):
+            result = creator.run(head_branch="fix-issue-5", title="Fix")
+
+        assert result["pr_number"] == 5
+        assert [method for method, _ in requests_seen] == ["POST", "POST", "GET"]
+        assert "head=owner%3Afix-issue-5" in requests_seen[2][1]
+        assert "state=open" in requests_seen[2][1]
+
+    def test_422_on_first_attempt_is_raised(self, creator: GitHubPRCreator) -> None:
+        """Test that a 422 that is not the answer to a replay is reported as an error"""
+        methods: list = []
+
+        def make_request(
+            pool: Any, conn: Any, method: str, url: str, **kwargs: Any
+        ) -> HTTPResponse:
+            methods.append(method)
+            return _raw_response(
+                422, {"message": "Validation Failed"}, kwargs["retries"]
+            )
+
+        with patch(
+            "urllib3.connectionpool.HTTPConnectionPool._make_request",
+            autospec=True,
+            side_effect=make_request,
+        ):
+            with pytest.raises(RuntimeError, match="Failed to create PR"):
+                creator.run(head_branch="fix-issue-5", title="Fix")
+
+        assert methods == ["POST"]
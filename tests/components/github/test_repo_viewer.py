@@ -0,0 +1,117 @@
+import base64
+from itertools import count
+from pathlib import Path
+from typing import Optional
+from unittest.mock import Mock, patch
+
+import orjson
+
+from dc_custom_component.components.github import repo_viewer
+from dc_custom_component.components.github.repo_viewer import GithubRepositoryViewer
+
+
+def _file_response(name: str, content: str, etag: Optional[str] = None) -> Mock:
+    response = Mock(status_code=200, headers={"ETag": etag} if etag else {})
+    response.content = orjson.dumps(
+        {
+            "name": name,
+            "path": name,
+            "size": len(content),
+            "html_url": f"https://github.com/owner/repo/blob/main/{name}",
+            "download_url": f"https://raw.githubusercontent.com/owner/repo/main/{name}",
+            "content": base64.b64encode(content.encode()).decode(),
+            "encoding": "base64",
+        }
+    )
+    return response
+
+
+def _not_modified() -> Mock:
+    return Mock(status_code=304, headers={}, content=b"")
+
+
+def _cached_urls(viewer: GithubRepositoryViewer) -> set:
+    rows = viewer._get_disk_cache().execute("SELECT url FROM etags").fetchall()
+    return {row[0].rsplit("/", 1)[-1] for row in rows}
+
+
+class TestGithubRepositoryViewerDiskCache:
+    def test_disk_cache_survives_restart_and_is_reused_on_304(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that a new viewer revalidates with the stored ETag and serves the stored body on 304"""
+        cache_path = str(tmp_path / "cache.sqlite")
+
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value = _file_response("README.md", "Hello", etag='"v1"')
+            with GithubRepositoryViewer(cache_path=cache_path) as viewer:
+                viewer.run(path="README.md", repo="owner/repo")
+
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value = _not_modified()
+            with GithubRepositoryViewer(cache_path=cache_path) as viewer:
+                documents = viewer.run(path="README.md", repo="owner/repo")["documents"]
+
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert documents[0].content == "Hello"
+        assert documents[0].meta["type"] == "file_content"
+
+    def test_close_releases_disk_cache_and_reopens_on_next_run(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that close() drops the SQLite connection and a later run opens it again"""
+        viewer = GithubRepositoryViewer(cache_path=str(tmp_path / "cache.sqlite"))
+
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value = _file_response("README.md", "Hello", etag='"v1"')
+            viewer.run(path="README.md", repo="owner/repo")
+            viewer.close()
+            assert viewer._disk_cache is None
+
+            mock_get.return_value = _not_modified()
+            documents = viewer.run(path="README.md", repo="owner/repo")["documents"]
+
+        viewer.close()
+        assert documents[0].content == "Hello"
+
+    def test_disk_cache_evicts_least_recently_used_beyond_size_limit(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that entries are evicted by last use once DISK_CACHE_MAX_BYTES is exceeded"""
+        viewer = GithubRepositoryViewer(cache_path=str(tmp_path / "cache.sqlite"))
+        body_size = len(_file_response("a.txt", "x" * 100).content)
+        clock = count(1)
+
+        with (
+            patch("requests.Session.get") as mock_get,
+            patch.object(repo_viewer, "DISK_CACHE_MAX_BYTES", 3 * body_size),
+            patch.object(repo_viewer.time, "time", side_effect=lambda: next(clock)),
+        ):
+            for name in ("a.txt", "b.txt", "c.txt"):
+                mock_get.return_value = _file_response(
+                    name, "x" * 100, etag=f'"{name}"'
+                )
+                viewer.run(path=name, repo="owner/repo")
+
+            # Revalidating a.txt makes b.txt the least recently used entry
+            mock_get.return_value = _not_modified()
+            viewer.run(path="a.txt", repo="owner/repo")
+
+            mock_get.return_value = _file_response("d.txt", "x" * 100, etag='"d.txt"')
+            viewer.run(path="d.txt", repo="owner/repo")
+
+        assert _cached_urls(viewer) == {"a.txt", "c.txt", "d.txt"}
+
+    def test_responses_without_etag_are_not_stored_on_disk(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that a response without an ETag is neither cached nor revalidated"""
+        viewer = GithubRepositoryViewer(cache_path=str(tmp_path / "cache.sqlite"))
+
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value = _file_response("README.md", "Hello")
+            viewer.run(path="README.md", repo="owner/repo")
+            viewer.run(path="README.md", repo="owner/repo")
+
+        assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+        assert _cached_urls(viewer) == set()
@@ -0,0 +1,58 @@
+from unittest.mock import Mock, patch
+
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+from dc_custom_component.components.github.retry import GithubRetry, get_session
+
+
+class TestGithubRetry:
+    def test_secondary_rate_limit_retried_after_header(self) -> None:
+        """Test that a 403 with Retry-After is retried after the requested delay"""
+        retry = GithubRetry(total=3)
+        response = HTTPResponse(status=403, headers={"Retry-After": "5"})
+
+        assert retry.is_retry("GET", 403, has_retry_after=True) is True
+        assert retry.is_retry("GET", 403, has_retry_after=False) is False
+        with patch("time.sleep") as mock_sleep:
+            retry.sleep(response)
+        mock_sleep.assert_called_once_with(5)
+
+    @patch(
+        "dc_custom_component.components.github.retry.time.time",
+        Mock(return_value=1000.0),
+    )
+    def test_primary_rate_limit_waits_for_reset(self) -> None:
+        """Test that an exhausted primary rate limit waits until its reset, capped at RATE_LIMIT_WAIT_MAX"""
+        retry = GithubRetry(total=3)
+
+        def exhausted(reset: int) -> HTTPResponse:
+            return HTTPResponse(
+                status=429,
+                headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)},
+            )
+
+        assert retry.get_retry_after(exhausted(1020)) == 20.0
+        assert retry.get_retry_after(exhausted(4600)) == GithubRetry.RATE_LIMIT_WAIT_MAX
+        assert (
+            retry.get_retry_after(
+                HTTPResponse(status=429, headers={"X-RateLimit-Remaining": "12"})
+            )
+            is None
+        )
+        with patch("time.sleep") as mock_sleep:
+            retry.sleep(exhausted(1020))
+        mock_sleep.assert_called_once_with(20.0)
+
+    def test_get_session_is_shared_per_retry_policy(self) -> None:
+        """Test that components with the same retry policy share one session"""
+        session = get_session(2, allowed_methods=["POST"])
+        adapter = session.get_adapter("https://api.github.com")
+        assert isinstance(adapter, HTTPAdapter)
+        retry = adapter.max_retries
+
+        assert get_session(2, allowed_methods=("POST",)) is session
+        assert get_session(2) is not session
+        assert isinstance(retry, GithubRetry)
+        assert retry.total == 2
+        assert retry.allowed_methods == frozenset({"POST"})
@@ -0,0 +1,41 @@
+from dc_custom_component.components.parsers.chat_history_parser import (
+    DeepsetChatHistoryParser,
+)
+
+
+class TestDeepsetChatHistoryParser:
+    def test_brackets_inside_strings_do_not_end_the_history(self) -> None:
+        """Test that a closing bracket inside a message does not end the history array"""
+        text = (
+            'Chat History: [{"role": "user", "content": "What does a[0] ] mean?"}, '
+            '{"role": "assistant", "content": "Indexing"}] '
+            "Current Question: And a[1]?"
+        )
+
+        messages = DeepsetChatHistoryParser().run(history_and_query=text)["messages"]
+
+        assert [message.text for message in messages] == [
+            "What does a[0] ] mean?",
+            "Indexing",
+            "And a[1]?",
+        ]
+
+    def test_escaped_quotes_do_not_end_strings(self) -> None:
+        """Test that an escaped quote keeps the scan inside the string, so the bracket after it is skipped"""
+        text = (
+            'Chat History: [{"role": "user", "content": "Quote \\"]\\" and \\\\"}] '
+            "Current Question: Why?"
+        )
+
+        messages = DeepsetChatHistoryParser().run(history_and_query=text)["messages"]
+
+        assert [message.text for message in messages] == ['Quote "]" and \\', "Why?"]
+
+    def test_find_array_end_handles_single_quoted_literals(self) -> None:
+        """Test that brackets in single-quoted Python literals are skipped as well"""
+        text = "[{'role': 'user', 'content': 'it\\'s ] here'}] rest"
+
+        end = DeepsetChatHistoryParser._find_array_end(text, 0)
+
+        assert text[:end] == "[{'role': 'user', 'content': 'it\\'s ] here'}]"
+        assert DeepsetChatHistoryParser._find_array_end("[1, [2]", 0) == -1
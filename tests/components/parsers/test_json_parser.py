@@ -0,0 +1,37 @@
+from dc_custom_component.components.parsers.json_parser import JsonParser
+
+
+class TestJsonParser:
+    def test_braces_inside_strings_are_not_counted(self) -> None:
+        """Test that a closing brace inside a string value does not end the JSON object"""
+        text = 'Result: {"template": "Hello {name}}", "count": 2} Done'
+
+        assert JsonParser.find_matching_braces(text) == [
+            '{"template": "Hello {name}}", "count": 2}'
+        ]
+        assert JsonParser().run(text=text)["parsed_json"] == {
+            "template": "Hello {name}}",
+            "count": 2,
+        }
+
+    def test_escaped_quotes_do_not_end_strings(self) -> None:
+        """Test that an escaped quote keeps the scan inside the string, so the brace after it is skipped"""
+        text = 'Answer {"quote": "say \\"}\\" and \\\\", "ok": true} trailing }'
+
+        assert JsonParser().run(text=text)["parsed_json"] == {
+            "quote": 'say "}" and \\',
+            "ok": True,
+        }
+
+    def test_quotes_outside_objects_are_ignored(self) -> None:
+        """Test that a stray quote before the object does not hide its braces"""
+        text = 'He said "see below: {"a": 1}'
+
+        assert JsonParser().run(text=text)["parsed_json"] == {"a": 1}
+
+    def test_stray_quote_in_malformed_group_does_not_hide_later_json(self) -> None:
+        """Test that an unclosed group, e.g. from an unbalanced quote, is rescanned after its opening brace"""
+        text = '{ he said "hi } and then {"x": 1}'
+
+        assert JsonParser.find_matching_braces(text) == ['{"x": 1}']
+        assert JsonParser().run(text=text)["parsed_json"] == {"x": 1}
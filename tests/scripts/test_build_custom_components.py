@@ -0,0 +1,120 @@
+import sys
+import zipfile
+import zlib
+from pathlib import Path
+
+import pytest
+
+# The scripts are run from the command line and import each other by module name
+sys.path.insert(0, str(Path(__file__).parents[2] / "scripts"))
+
+import build_custom_components as build  # noqa: E402
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a project tree with enough component files for the parallel build"""
+    package_dir = tmp_path / "src" / "dc_custom_component"
+    components_dir = package_dir / "components"
+    for i in range(build.PARALLEL_MIN_FILES):
+        module_dir = components_dir / f"module_{i % 4}"
+        module_dir.mkdir(parents=True, exist_ok=True)
+        (module_dir / f"file_{i}.py").write_text(f"VALUE = {i}\n" * (i + 1) * 20)
+    (components_dir / "tiny.py").write_text("X = 1\n")
+    (package_dir / "__about__.py").write_text('__version__ = "0.0.1"\n')
+    (package_dir / "__init__.py").write_text("")
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
+    (tmp_path / "README.md").write_text("# Test\n")
+    return tmp_path
+
+
+def _build(project: Path, **kwargs: object) -> zipfile.ZipFile:
+    package_dir = project / "src" / "dc_custom_component"
+    output_zip = project / "dist" / "custom_component.zip"
+    assert build.create_zip_file(
+        components_dir=package_dir / "components",
+        about_init_dir=package_dir,
+        output_zip=output_zip,
+        project_root=project,
+        **kwargs,
+    )
+    return zipfile.ZipFile(output_zip)
+
+
+class TestCreateZipFile:
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_archive_round_trips(self, project: Path, max_workers: int) -> None:
+        """Test that serial and parallel (precompressed) builds produce a valid archive with the file contents"""
+        with _build(project, max_workers=max_workers) as zipf:
+            assert zipf.testzip() is None
+            source = project / "src" / "dc_custom_component" / "components"
+            for path in source.rglob("*.py"):
+                arcname = (
+                    build.COMPONENTS_ARCNAME_PREFIX
+                    + path.relative_to(source).as_posix()
+                )
+                assert zipf.read(arcname) == path.read_bytes()
+
+            infos = {info.filename: info for info in zipf.infolist()}
+            tiny = infos[build.COMPONENTS_ARCNAME_PREFIX + "tiny.py"]
+            large = infos[build.COMPONENTS_ARCNAME_PREFIX + "module_3/file_63.py"]
+            assert tiny.compress_type == zipfile.ZIP_STORED
+            assert large.compress_type == zipfile.ZIP_DEFLATED
+            assert "pyproject.toml" in infos
+            assert "src/dc_custom_component/__about__.py" in infos
+
+    def test_exclude_patterns_match_absolute_and_relative_paths(
+        self, project: Path
+    ) -> None:
+        """Test that patterns written for absolute paths and for relative paths both exclude files"""
+        components_dir = project / "src" / "dc_custom_component" / "components"
+        (components_dir / "tests").mkdir()
+        (components_dir / "tests" / "test_module.py").write_text("")
+        (components_dir / "module_0" / "local.env").write_text("SECRET=1\n")
+
+        with _build(project, exclude_patterns=["*/tests/*", "module_0/*.env"]) as zipf:
+            names = zipf.namelist()
+
+        assert not any("/components/tests/" in name for name in names)
+        assert not any(name.endswith("local.env") for name in names)
+        assert build.COMPONENTS_ARCNAME_PREFIX + "module_0/file_0.py" in names
+
+    def test_isal_backend_is_restored_after_build(self, project: Path) -> None:
+        """Test that zipfile's zlib and crc32 are only replaced while the archive is written"""
+        if build.isal_zlib is None:
+            pytest.skip("isal is not installed")
+        with _build(project, max_workers=1) as zipf:
+            assert zipf.testzip() is None
+
+        assert zipfile.zlib is zlib  # type: ignore[attr-defined]
+        assert zipfile.crc32 is zlib.crc32  # type: ignore[attr-defined]
+
+    def test_current_python_supports_precompressed_entries(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that the zipfile internals used by the parallel build exist on this Python version"""
+        with zipfile.ZipFile(tmp_path / "archive.zip", "w") as zipf:
+            assert build._supports_precompressed(zipf)
+
+
+class TestComputeManifest:
+    def test_manifest_changes_with_exclude_patterns_and_backend(
+        self, project: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the build is redone when the exclude patterns or the DEFLATE backend change"""
+        package_dir = project / "src" / "dc_custom_component"
+
+        def manifest(exclude_patterns: list[str]) -> str:
+            result: str = build.compute_manifest(
+                package_dir / "components", package_dir, project, exclude_patterns, 1
+            )
+            return result
+
+        base = manifest(["*.pyc"])
+        assert manifest(["*.pyc"]) == base
+        assert manifest(["*.pyc", "*/tests/*"]) != base
+
+        monkeypatch.setattr(
+            build, "isal_zlib", None if build.isal_zlib is not None else object()
+        )
+        assert manifest(["*.pyc"]) != base